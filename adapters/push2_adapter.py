@@ -1,6 +1,8 @@
+import logging
 import push2_python
 import time
 import threading
+from itertools import islice
 from typing import Optional, List
 from adapters.ui_adapter import UIAdapter
 from core.sequencer_engine import SequencerEngine
@@ -8,13 +10,96 @@ from core.sequencer_event_bus import SequencerEvent, EventType
 from dynamic_device_manager import DynamicDeviceManager
 from project_manager import ProjectManager
 from ui_main import SequencerUI
+from ui.display_renderer import CC_ENCODER_KEYS
 from handlers.button_manager import ButtonManager
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_BUTTON_STATE = 'dark_gray'
+# The Push 2 blanks its display after ~2s without a frame, so resend at least this often
+DISPLAY_KEEPALIVE_INTERVAL = 1.0
+
+# Button constants resolved once at import instead of on every update
+UPPER_ROW_BUTTONS = tuple(getattr(push2_python.constants, f'BUTTON_UPPER_ROW_{i}') for i in range(1, 9))
+LOWER_ROW_BUTTONS = tuple(getattr(push2_python.constants, f'BUTTON_LOWER_ROW_{i}') for i in range(1, 9))
+BUTTON_PLAY = push2_python.constants.BUTTON_PLAY
+BUTTON_ADD_TRACK = push2_python.constants.BUTTON_ADD_TRACK
+BUTTON_OCTAVE_UP = push2_python.constants.BUTTON_OCTAVE_UP
+BUTTON_OCTAVE_DOWN = push2_python.constants.BUTTON_OCTAVE_DOWN
+BUTTON_DELETE = push2_python.constants.BUTTON_DELETE
+BUTTON_OK = push2_python.constants.BUTTON_UPPER_ROW_8
+FRAME_FORMAT_RGB565 = push2_python.constants.FRAME_FORMAT_RGB565
+
+# Pad grid lookup tables: top 4 rows are the 32 sequencer steps, bottom 4 the keyboard
+STEP_PADS = tuple((step // 8, step % 8) for step in range(32))
+PAD_STEPS = {pad: step for step, pad in enumerate(STEP_PADS)}
+KEYBOARD_PADS = tuple((row, col) for row in range(4, 8) for col in range(8))
+FRAME_PADS = STEP_PADS + KEYBOARD_PADS  # Pad at each index of the 64-pad color frame
+NO_KEY = 0xFF  # Keyboard note table entry for gap pads that play nothing
+
+# Piano keyboard layout, two octaves from C3
+# Rows 5 and 7 (6 and 8 in human terms): white keys C-D-E-F-G-A-B-C
+# Rows 4 and 6 (5 and 7 in human terms): black keys C#-D#-F#-G#-A# with gaps at columns 0, 3, 7
+WHITE_KEY_PADS = frozenset((row, col) for row in (5, 7) for col in range(8))
+BLACK_KEY_PADS = frozenset((row, col) for row in (4, 6) for col in (1, 2, 4, 5, 6))
+GAP_KEY_PADS = frozenset((row, col) for row in (4, 6) for col in (0, 3, 7))
+PIANO_NOTES = {
+    **{(7, col): note for col, note in enumerate((48, 50, 52, 53, 55, 57, 59, 60))},  # C3-C4
+    **{(5, col): note for col, note in enumerate((60, 62, 64, 65, 67, 69, 71, 72))},  # C4-C5
+    **{(6, col): note for col, note in zip((1, 2, 4, 5, 6), (49, 51, 54, 56, 58))},  # C#3-A#3
+    **{(4, col): note for col, note in zip((1, 2, 4, 5, 6), (61, 63, 66, 68, 70))},  # C#4-A#4
+}
+
+# Pad colors as single-byte ids so a whole frame fits in a 64-byte bytearray
+PAD_COLORS = ('black', 'white', 'light_gray', 'dark_gray', 'blue', 'green', 'turquoise',
+              'red', 'yellow', 'purple', 'cyan', 'pink', 'orange', 'lime')
+PAD_COLOR_IDS = {color: color_id for color_id, color in enumerate(PAD_COLORS)}
+# Ids of the fixed colors the frame is built from, so the pad loops compare and store ints
+(COLOR_WHITE, COLOR_LIGHT_GRAY, COLOR_DARK_GRAY, COLOR_BLUE, COLOR_GREEN, COLOR_TURQUOISE,
+ COLOR_RED) = (PAD_COLOR_IDS[color] for color in
+               ('white', 'light_gray', 'dark_gray', 'blue', 'green', 'turquoise', 'red'))
+
+def _keyboard_key_colors(white_keys, black_keys, disabled_keys):
+    """Static color id of each keyboard pad: gaps dark, white and black keys, others dim"""
+    colors = bytearray(len(KEYBOARD_PADS))
+    for index, pad_pos in enumerate(KEYBOARD_PADS):
+        if pad_pos in disabled_keys:
+            colors[index] = COLOR_DARK_GRAY
+        elif pad_pos in white_keys:
+            colors[index] = COLOR_WHITE
+        elif pad_pos in black_keys:
+            colors[index] = COLOR_TURQUOISE
+        else:
+            colors[index] = COLOR_LIGHT_GRAY
+    return bytes(colors)
+
+# Key colors of the shared piano layout, so refreshes only overlay selected and held keys
+KEYBOARD_KEY_COLORS = _keyboard_key_colors(WHITE_KEY_PADS, BLACK_KEY_PADS, GAP_KEY_PADS)
+# Starting frame: step pads dim white (outside any range), keyboard pads in their key colors
+BASE_PAD_FRAME = bytes([COLOR_LIGHT_GRAY] * len(STEP_PADS)) + KEYBOARD_KEY_COLORS
+# One color per track, shared by every adapter
+TRACK_COLORS = ('red', 'blue', 'yellow', 'purple', 'cyan', 'pink', 'orange', 'lime')
 
 class Push2Adapter(UIAdapter):
     """Push2 UI adapter implementation"""
     
+    # Last pad frame (64 color ids, row-major) sent to the hardware (None forces a full send)
+    _pad_frame = None
+    # Inputs the last frame was built from (None forces a rebuild)
+    _pad_state_key = None
+    # Guards the pad frame cache and the sends made from it
+    _pad_lock = threading.Lock()
+    # MIDI note per keyboard pad, and the octave offset and layout tables it was
+    # built from (None forces a rebuild)
+    _keyboard_notes = None
+    _keyboard_notes_key = None
+    track_colors = TRACK_COLORS
+    # Keyboard layout shared by every adapter; tests may assign their own
+    white_key_positions = WHITE_KEY_PADS
+    black_key_positions = BLACK_KEY_PADS
+    disabled_key_positions = GAP_KEY_PADS
+    piano_note_mapping = PIANO_NOTES
+    
     def __init__(self, sequencer: SequencerEngine, use_simulator=False):
         super().__init__(sequencer)
         
@@ -33,7 +118,6 @@ class Push2Adapter(UIAdapter):
         self.cc_values = {}
         self.last_encoder_time = 0
         self.tracks = [None] * 8
-        self.track_colors = ['red', 'blue', 'yellow', 'purple', 'cyan', 'pink', 'orange', 'lime']
         self.current_track = 0
         self.device_selection_mode = False
         self.device_selection_index = 0
@@ -42,14 +126,13 @@ class Push2Adapter(UIAdapter):
         self.encoder_threshold = 1 if use_simulator else 13
         
         # New pad-based range selection state
-        self.pressed_pads = {}  # Track currently pressed pads: {(row, col): timestamp}
+        self.pressed_pads = {}  # Track currently pressed pads: {(row, col): monotonic_ns timestamp}
         self.selected_range_start = 0  # First step in active range
         self.selected_range_end = 31   # Last step in active range (default full 32 steps)
         self.held_keyboard_pads = set()  # Currently held keyboard pads
         self.keyboard_octave_offset = 0  # Octave offset for keyboard
         self.keyboard_notes_c = set()  # C note positions on keyboard for highlighting
         self._init_keyboard_c_notes()
-        self._init_piano_keyboard_layout()  # Initialize piano keyboard layout
         
         # Clock source selection
         self.clock_selection_mode = False
@@ -72,16 +155,7 @@ class Push2Adapter(UIAdapter):
         # Display refresh rates
         self.fast_refresh_rate = 0.02
         self.normal_refresh_rate = 0.5
-        
-        # Button constants
-        self.UPPER_ROW_BUTTON_CONSTANTS = [
-            'BUTTON_UPPER_ROW_1', 'BUTTON_UPPER_ROW_2', 'BUTTON_UPPER_ROW_3', 'BUTTON_UPPER_ROW_4',
-            'BUTTON_UPPER_ROW_5', 'BUTTON_UPPER_ROW_6', 'BUTTON_UPPER_ROW_7', 'BUTTON_UPPER_ROW_8'
-        ]
-        self.LOWER_ROW_BUTTON_CONSTANTS = [
-            'BUTTON_LOWER_ROW_1', 'BUTTON_LOWER_ROW_2', 'BUTTON_LOWER_ROW_3', 'BUTTON_LOWER_ROW_4',
-            'BUTTON_LOWER_ROW_5', 'BUTTON_LOWER_ROW_6', 'BUTTON_LOWER_ROW_7', 'BUTTON_LOWER_ROW_8'
-        ]
+        self._dirty = threading.Event()  # Set whenever visible state changes
         
         # Initialize components
         self.device_manager.refresh_devices()
@@ -113,54 +187,30 @@ class Push2Adapter(UIAdapter):
         # For the new piano layout, we'll highlight C notes differently
         self.keyboard_notes_c = set()
         
-    def _init_piano_keyboard_layout(self):
-        """Initialize piano keyboard layout mapping"""
-        # Define which pads trigger notes
-        # Rows 6 and 8: White keys (C-D-E-F-G-A-B-C)
-        # Rows 5 and 7: Black keys (C#-D#-F#-G#-A#) with gaps at positions 0, 3, 7
-        self.white_key_positions = set()
-        self.black_key_positions = set()
-        self.disabled_key_positions = set()
-        
-        # White keys: rows 5 and 7, all 8 columns
-        for row in [5, 7]:  # Rows 6 and 8 in human terms
-            for col in range(8):
-                self.white_key_positions.add((row, col))
-        
-        # Black keys: rows 4 and 6, columns 0-7 but with gaps
-        for row in [4, 6]:  # Rows 5 and 7 in human terms
-            for col in range(8):
-                # Gaps at 1st, 4th, 8th pads (0-indexed: positions 0, 3, 7)
-                if col in [0, 3, 7]:
-                    self.disabled_key_positions.add((row, col))
-                else:
-                    self.black_key_positions.add((row, col))
-        
-        # Map pad positions to note values for piano layout
-        self.piano_note_mapping = {}
-        
-        # Define note mappings for each row
-        # Row 7: C3 to C4 (white keys, bottom row)
-        white_notes_row7 = [48, 50, 52, 53, 55, 57, 59, 60]  # C3-D3-E3-F3-G3-A3-B3-C4
-        for col, note in enumerate(white_notes_row7):
-            self.piano_note_mapping[(7, col)] = note
-            
-        # Row 5: C4 to C5 (white keys, middle row)
-        white_notes_row5 = [60, 62, 64, 65, 67, 69, 71, 72]  # C4-D4-E4-F4-G4-A4-B4-C5
-        for col, note in enumerate(white_notes_row5):
-            self.piano_note_mapping[(5, col)] = note
-            
-        # Row 6: Black keys one octave lower (above row 7 white keys)
-        black_notes_row6 = [49, 51, 54, 56, 58]  # C#3-D#3-F#3-G#3-A#3
-        black_cols_row6 = [1, 2, 4, 5, 6]  # Skip positions 0, 3, 7
-        for col, note in zip(black_cols_row6, black_notes_row6):
-            self.piano_note_mapping[(6, col)] = note
-            
-        # Row 4: Black keys middle octave (above row 5 white keys)
-        black_notes_row4 = [61, 63, 66, 68, 70]  # C#4-D#4-F#4-G#4-A#4
-        black_cols_row4 = [1, 2, 4, 5, 6]  # Skip positions 0, 3, 7
-        for col, note in zip(black_cols_row4, black_notes_row4):
-            self.piano_note_mapping[(4, col)] = note
+    def _build_keyboard_notes(self):
+        """Resolve every keyboard pad to its MIDI note at the current octave"""
+        offset = self.keyboard_octave_offset * 12
+        notes = bytearray(len(KEYBOARD_PADS))
+        for index, (row, col) in enumerate(KEYBOARD_PADS):
+            if (row, col) in self.disabled_key_positions:
+                notes[index] = NO_KEY
+                continue
+            note = self.piano_note_mapping.get((row, col))
+            if note is None:
+                # Fallback for any unmapped positions
+                note = 48 + (7 - row) * 8 + col  # C3 base
+            notes[index] = max(0, min(127, note + offset))  # Clamp to MIDI range
+        self._keyboard_notes = notes
+    
+    def _keyboard_note(self, row, col):
+        """MIDI note for a keyboard pad, or NO_KEY for a gap pad"""
+        # Reassigning either layout table (as tests do) also forces a rebuild
+        key = (self.keyboard_octave_offset, id(self.piano_note_mapping),
+               id(self.disabled_key_positions))
+        if self._keyboard_notes_key != key:
+            self._build_keyboard_notes()
+            self._keyboard_notes_key = key
+        return self._keyboard_notes[(row - 4) * 8 + col]
     
     def _setup_range_aware_note_system(self):
         """Setup range-aware note management that works at adapter level"""
@@ -170,11 +220,12 @@ class Push2Adapter(UIAdapter):
         # Create range-aware version
         def range_aware_add_note(track, step, note, velocity):
             """Add note only if step is within active range"""
-            if track == self.current_track:
-                # Check if step is within active range
-                if not self._is_step_in_active_range(step):
-                    print(f"Ignoring note at step {step} (outside active range {self.selected_range_start}-{self.selected_range_end})")
-                    return
+            # Range check inlined: this wraps every note entry
+            if track == self.current_track and not (
+                    self.selected_range_start <= step <= self.selected_range_end):
+                logger.debug("Ignoring note at step %d (outside active range %d-%d)",
+                             step, self.selected_range_start, self.selected_range_end)
+                return
                     
             # Call original add_note method
             return self._original_add_note(track, step, note, velocity)
@@ -182,7 +233,8 @@ class Push2Adapter(UIAdapter):
         # Replace the add_note method
         self.sequencer.add_note = range_aware_add_note
         
-        print(f"Range-aware note system installed. Active range: {self.selected_range_start}-{self.selected_range_end}")
+        logger.debug("Range-aware note system installed. Active range: %d-%d",
+                     self.selected_range_start, self.selected_range_end)
     
     def _setup_event_handlers(self):
         """Subscribe to sequencer events"""
@@ -198,22 +250,33 @@ class Push2Adapter(UIAdapter):
     
     def on_step_changed(self, event: SequencerEvent) -> None:
         """Handle step change events"""
+        # The playhead only shows on the pads, so steps don't redraw the display.
+        # Transport and tempo changes are picked up by the run loop's snapshot,
+        # and its keepalive resends the frame while nothing else changes
         self._update_pad_colors()
     
     def on_play_state_changed(self, event: SequencerEvent) -> None:
         """Handle play state change events"""
         self._update_pad_colors()
+        self._request_redraw()
 
     def on_pattern_modified(self, event: SequencerEvent) -> None:
         """Handle pattern modification events"""
         self._update_pad_colors()
+        self._request_redraw()
     
     def on_pattern_length_changed(self, event: SequencerEvent) -> None:
         """Handle pattern length change events"""
         track = event.data['track']
         length = event.data['length']
-        print(f"Track {track} pattern length changed to {length}")
+        logger.debug("Track %d pattern length changed to %d", track, length)
         self._update_pad_colors()
+        self._request_redraw()
+
+    def _request_redraw(self):
+        """Wake the run loop so the next frame is rendered"""
+        self.ui.invalidate()
+        self._dirty.set()
     
     def _setup_push2_handlers(self):
         """Setup Push2 event handlers"""
@@ -221,52 +284,36 @@ class Push2Adapter(UIAdapter):
         def on_pad_pressed(push, pad_n, pad_ij, velocity):
             row, col = pad_ij
             pad_id = (row, col)
-            current_time = time.time()
+            step = PAD_STEPS.get(pad_id)
             
             # Top 4 rows: Step sequencer (32 steps)
-            if row < 4:
-                step = row * 8 + col
-                if step < 32:
-                    # Track pressed pad for range selection
-                    self.pressed_pads[pad_id] = current_time
-                    
-                    # Check for range selection (2 pads pressed within 200ms)
-                    if len(self.pressed_pads) == 2:
-                        self._process_range_selection()
+            if step is not None:
+                # Track pressed pad for range selection
+                self.pressed_pads[pad_id] = time.monotonic_ns()
+                
+                # Check for range selection (2 pads pressed within 200ms)
+                if len(self.pressed_pads) == 2:
+                    self._process_range_selection()
+                else:
+                    # Single pad press - toggle step selection
+                    if self.held_step_pad == step:
+                        # Deselect if same step pressed again
+                        self.held_step_pad = None
+                        logger.debug("Deselected step %d", step)
                     else:
-                        # Single pad press - toggle step selection
-                        if self.held_step_pad == step:
-                            # Deselect if same step pressed again
-                            self.held_step_pad = None
-                            print(f"Deselected step {step}")
-                        else:
-                            # Select new step for note input
-                            self.held_step_pad = step
-                            print(f"Selected step {step} for note input")
-                        self._update_pad_colors()
+                        # Select new step for note input
+                        self.held_step_pad = step
+                        logger.debug("Selected step %d for note input", step)
+                    self._update_pad_colors()
             
             # Bottom 4 rows: MIDI keyboard (piano layout)
             else:
-                # Check if this is a valid key position
-                pad_pos = (row, col)
-                
-                # Skip disabled pads in black key rows
-                if pad_pos in self.disabled_key_positions:
-                    return  # Do nothing for disabled pads
+                # Piano layout note with octave offset, precomputed per octave
+                note = self._keyboard_note(row, col)
+                if note == NO_KEY:
+                    return  # Do nothing for disabled pads in black key rows
                     
                 if self.tracks[self.current_track] is not None:
-                    # Calculate note based on piano layout mapping
-                    if pad_pos in self.piano_note_mapping:
-                        note = self.piano_note_mapping[pad_pos]
-                        # Apply octave offset
-                        note += self.keyboard_octave_offset * 12
-                        note = max(0, min(127, note))  # Clamp to MIDI range
-                    else:
-                        # Fallback for any unmapped positions
-                        base_note = 48 + self.keyboard_octave_offset * 12  # C3 base
-                        note = base_note + (7 - row) * 8 + col
-                        note = max(0, min(127, note))  # Clamp to MIDI range
-                    
                     # Get track channel from sequencer
                     channel = self.sequencer._internal_sequencer.track_channels[self.current_track]
                     port_name = getattr(self.sequencer._internal_sequencer, '_track_ports', {}).get(self.current_track)
@@ -274,7 +321,8 @@ class Push2Adapter(UIAdapter):
                     # If step is selected, add note to sequencer
                     if self.held_step_pad is not None:
                         self.sequencer.add_note(self.current_track, self.held_step_pad, note, velocity)
-                        print(f"Added keyboard note {note} to track {self.current_track} step {self.held_step_pad}")
+                        logger.debug("Added keyboard note %d to track %d step %d",
+                                     note, self.current_track, self.held_step_pad)
                     
                     # Trigger note on device
                     self.midi_output.send_note_on(channel, note, velocity, port_name)
@@ -283,20 +331,20 @@ class Push2Adapter(UIAdapter):
                     # Schedule note off
                     threading.Timer(0.5, lambda: self._send_note_off(channel, note, port_name)).start()
 
+            self._request_redraw()
+
         @push2_python.on_pad_released()
         def on_pad_released(push, pad_n, pad_ij, velocity):
             row, col = pad_ij
             pad_id = (row, col)
             
             # Top 4 rows: Step sequencer
-            if row < 4:
-                step = row * 8 + col
-                if step < 32:
-                    # Remove from pressed pads
-                    if pad_id in self.pressed_pads:
-                        del self.pressed_pads[pad_id]
-                    
-                    # Keep step selected - don't clear on release
+            if pad_id in PAD_STEPS:
+                # Remove from pressed pads
+                if pad_id in self.pressed_pads:
+                    del self.pressed_pads[pad_id]
+                
+                # Keep step selected - don't clear on release
             
             # Bottom 4 rows: MIDI keyboard
             else:
@@ -304,30 +352,41 @@ class Push2Adapter(UIAdapter):
                 if pad_id not in self.disabled_key_positions:
                     if pad_id in self.held_keyboard_pads:
                         self.held_keyboard_pads.discard(pad_id)
+
+            self._request_redraw()
             
         @push2_python.on_button_released()
         def on_button_released(push, button_name):
             self.button_manager.handle_button_release(button_name)
+            self._request_redraw()
                 
         @push2_python.on_button_pressed()
         def on_button_pressed(push, button_name):
             if not self.button_manager.handle_button_press(button_name):
                 self._handle_remaining_buttons(button_name)
+            self._request_redraw()
                 
         @push2_python.on_encoder_rotated()
         def on_encoder_rotated(push, encoder_name, increment):
             self.button_manager.handle_encoder_rotation(encoder_name, increment)
+            self._request_redraw()
+
+        @push2_python.on_midi_connected()
+        def on_midi_connected(push):
+            # A (re)connected Push starts with dark pads, so the sent frame is stale
+            self._invalidate_pad_frame()
+            self._update_pad_colors()
     
     def _handle_remaining_buttons(self, button_name):
         """Handle buttons not in button manager"""
         match button_name:
             case push2_python.constants.BUTTON_OCTAVE_UP:
                 self.keyboard_octave_offset = min(5, self.keyboard_octave_offset + 1)
-                print(f"Keyboard octave up: {self.keyboard_octave_offset}")
+                logger.debug("Keyboard octave up: %d", self.keyboard_octave_offset)
                 
             case push2_python.constants.BUTTON_OCTAVE_DOWN:
                 self.keyboard_octave_offset = max(-2, self.keyboard_octave_offset - 1)
-                print(f"Keyboard octave down: {self.keyboard_octave_offset}")
+                logger.debug("Keyboard octave down: %d", self.keyboard_octave_offset)
                 
             case push2_python.constants.BUTTON_DELETE:
                 if (self.held_step_pad is not None and
@@ -338,7 +397,7 @@ class Push2Adapter(UIAdapter):
                         notes = self.sequencer._internal_sequencer.tracks[self.current_track].get_notes_at_step(self.held_step_pad)
                         if notes:
                             self.sequencer.remove_note(self.current_track, self.held_step_pad)
-                            print(f"Cleared track {self.current_track} step {self.held_step_pad}")
+                            logger.debug("Cleared track %d step %d", self.current_track, self.held_step_pad)
                             self._update_pad_colors()
                     
             case push2_python.constants.BUTTON_UPPER_ROW_8:
@@ -347,20 +406,17 @@ class Push2Adapter(UIAdapter):
                     self.button_manager.clock.handle_confirm_clock_selection()
                 elif self.device_selection_mode or self.track_edit_mode:
                     self.button_manager.device.handle_confirm_selection()
-                self.push.buttons.set_button_color(push2_python.constants.BUTTON_UPPER_ROW_8, DEFAULT_BUTTON_STATE)
+                self.push.buttons.set_button_color(BUTTON_OK, DEFAULT_BUTTON_STATE)
     
     def _process_range_selection(self):
         """Process 2-pad press for range selection"""
         if len(self.pressed_pads) != 2:
             return
             
-        # Get the two pressed pads
-        pad_positions = list(self.pressed_pads.keys())
-        pad1, pad2 = pad_positions[0], pad_positions[1]
-        
-        # Calculate step numbers
-        step1 = pad1[0] * 8 + pad1[1]
-        step2 = pad2[0] * 8 + pad2[1]
+        # Get the two pressed pads and their step numbers
+        pad1, pad2 = self.pressed_pads
+        step1 = PAD_STEPS[pad1]
+        step2 = PAD_STEPS[pad2]
         
         # Determine range (first and last step)
         new_range_start = min(step1, step2)
@@ -373,15 +429,14 @@ class Push2Adapter(UIAdapter):
         
         # Update sequencer pattern length AND range start to match UI range
         current_pattern_length = self.sequencer.get_pattern_length(self.current_track)
-        current_range_start = getattr(self.sequencer._internal_sequencer, '_range_starts', {})[self.current_track] if self.current_track in getattr(self.sequencer._internal_sequencer, '_range_starts', {}) else 0
+        current_range_start = getattr(self.sequencer._internal_sequencer, '_range_starts', {}).get(self.current_track, 0)
         
         if current_pattern_length != new_range_length or current_range_start != new_range_start:
             self.sequencer.set_pattern_length(self.current_track, new_range_length, new_range_start)
-            print(f"Pattern updated: length {current_pattern_length}→{new_range_length}, range {current_range_start}→{new_range_start}")
+            logger.debug("Pattern updated: length %d→%d, range %d→%d",
+                         current_pattern_length, new_range_length, current_range_start, new_range_start)
         
-        print(f"Range selection: steps {new_range_start} to {new_range_end}")
-        print(f"Active range length: {new_range_length} steps")
-        print(f"Sequencer pattern: length {self.sequencer.get_pattern_length(self.current_track)}, range start {current_range_start}")
+        logger.debug("Range selection: steps %d to %d (%d steps)", new_range_start, new_range_end, new_range_length)
         
         # Update visual feedback
         self._update_pad_colors()
@@ -399,9 +454,7 @@ class Push2Adapter(UIAdapter):
     
     def _get_step_position(self, step):
         """Convert step number to (row, col) position on grid"""
-        row = step // 8
-        col = step % 8
-        return (row, col)
+        return STEP_PADS[step]
     
     # UI state management methods (from original SequencerApp)
     def get_current_track_channel(self):
@@ -425,87 +478,163 @@ class Push2Adapter(UIAdapter):
             else:
                 color = DEFAULT_BUTTON_STATE
                 
-            button_name = self.LOWER_ROW_BUTTON_CONSTANTS[i]
-            if hasattr(push2_python.constants, button_name):
-                button_constant = getattr(push2_python.constants, button_name)
-                self.push.buttons.set_button_color(button_constant, color)
+            self.push.buttons.set_button_color(LOWER_ROW_BUTTONS[i], color)
     
     def _update_pad_colors(self):
         """Update pad colors with proper lighting system"""
-        # Small delay to prevent rapid successive calls from causing ghost pads
-        time.sleep(0.001)
-        
-        # Update top 4 rows: Step sequencer (32 steps)
-        # All 32 pads should be lit - dim white outside range, full white/colors in range
-        for row in range(4):
-            for col in range(8):
-                step = row * 8 + col
-                pad_pos = (row, col)
-                
-                # Determine color based on range and state
-                if self._is_step_in_active_range(step):
-                    # Within active range - full brightness
-                    if step == self.held_step_pad:
-                        color = 'blue'  # Selected for note input
-                    elif self._is_step_current(step):
-                        color = 'green'  # Currently playing
-                    elif (self.tracks[self.current_track] is not None and
-                          self._has_notes_at_step(step)):
-                        color = self.track_colors[self.current_track]  # Has notes
+        # Built, diffed and stored as one step: step callbacks, the push2 MIDI
+        # thread and the run loop all refresh the pads, and an interleaved
+        # refresh would leave _pad_frame out of step with the hardware
+        with self._pad_lock:
+            # Nothing that affects the pads changed since the last frame
+            key = self._get_pad_state_key()
+            if key is not None and key == self._pad_state_key:
+                return
+            self._pad_state_key = key
+        
+            # Small delay to prevent rapid successive calls from causing ghost pads
+            time.sleep(0.001)
+        
+            # Build the full frame as color ids, then send it below
+            frame = bytearray(BASE_PAD_FRAME)
+
+            # Group the active track's notes by step once instead of rescanning per pad
+            step_notes = self._collect_step_notes()
+
+            # Update top 4 rows: Step sequencer (32 steps)
+            # All 32 pads should be lit - dim white outside range, full white/colors in range.
+            # BASE_PAD_FRAME starts every step dim; the active range is filled in layers,
+            # lowest priority first: empty (full white), has notes, playing, selected.
+            start = self.selected_range_start
+            end = min(self.selected_range_end + 1, len(STEP_PADS))
+            if start < end:
+                frame[start:end] = bytes((COLOR_WHITE,)) * (end - start)
+            
+                if self.tracks[self.current_track] is not None:
+                    track_color = PAD_COLOR_IDS[self.track_colors[self.current_track]]
+                    if step_notes is not None:
+                        for step in step_notes:
+                            if start <= step < end:
+                                frame[step] = track_color
                     else:
-                        color = 'white'  # Active but empty (full white)
-                else:
-                    # Outside active range - dim white
-                    color = 'light_gray'  # Dim white for inactive range
-                
-                self.push.pads.set_pad_color(pad_pos, color)
-        
-        # Update bottom 4 rows: MIDI keyboard (piano layout)
-        for row in range(4, 8):
-            for col in range(8):
-                pad_pos = (row, col)
-                
-                # Keyboard pad colors based on piano layout
-                if pad_pos in self.disabled_key_positions:
-                    color = 'dark_gray'  # Disabled pads
-                elif pad_pos in self.held_keyboard_pads:
-                    color = 'red'  # Currently playing
-                elif (self.held_step_pad is not None and 
-                      self.tracks[self.current_track] is not None and
-                      self._is_note_at_step_and_pad(self.held_step_pad, pad_pos)):
-                    color = 'blue'  # Note exists at selected step
-                elif pad_pos in self.white_key_positions:
-                    color = 'white'  # White keys
-                elif pad_pos in self.black_key_positions:
-                    color = 'turquoise'  # Black keys
-                elif self.held_step_pad is not None and self.tracks[self.current_track] is not None:
-                    color = 'light_gray'  # Ready for note input (fallback)
-                else:
-                    color = 'light_gray'  # Normal keyboard (fallback)
-                
-                self.push.pads.set_pad_color(pad_pos, color)
+                        for step in range(start, end):
+                            if self._has_notes_at_step(step):
+                                frame[step] = track_color
+            
+                current_step = self._current_range_step()
+                if current_step is not None and start <= current_step < end:
+                    frame[current_step] = COLOR_GREEN
+                if self.held_step_pad is not None and start <= self.held_step_pad < end:
+                    frame[self.held_step_pad] = COLOR_BLUE
+        
+            # Update bottom 4 rows: MIDI keyboard (piano layout)
+            # Start from the static key colors, then overlay notes at the selected step
+            # and the keys being played; disabled gap pads always stay dark.
+            if not self._uses_shared_keyboard_layout():
+                frame[len(STEP_PADS):] = _keyboard_key_colors(
+                    self.white_key_positions, self.black_key_positions, self.disabled_key_positions)
+            disabled = self.disabled_key_positions
+            held_step = self.held_step_pad
+            if (held_step is not None and self.tracks[self.current_track] is not None and
+                    (step_notes is None or held_step in step_notes)):
+                for pad_pos in self.piano_note_mapping:
+                    if (pad_pos not in disabled and
+                            self._is_note_at_step_and_pad(held_step, pad_pos, step_notes)):
+                        frame[pad_pos[0] * 8 + pad_pos[1]] = COLOR_BLUE
+            for pad_pos in self.held_keyboard_pads:
+                if pad_pos not in disabled:
+                    frame[pad_pos[0] * 8 + pad_pos[1]] = COLOR_RED
+        
+            # Only talk to the hardware when something visible changed
+            previous = self._pad_frame
+            if previous is None:
+                self.push.pads.set_pads_color(
+                    [[PAD_COLORS[color_id] for color_id in frame[row * 8:row * 8 + 8]] for row in range(8)])
+            elif frame != previous:
+                # Send just the pads that changed, e.g. the old and new playhead
+                for pad, old_id, color_id in zip(FRAME_PADS, previous, frame):
+                    if old_id != color_id:
+                        self.push.pads.set_pad_color(pad, PAD_COLORS[color_id])
+            self._pad_frame = frame
     
-    def _is_step_current(self, step):
-        """Check if step is currently playing for the active track"""
+    def get_last_color(self, row, col):
+        """Color last sent to a pad, or None before the first frame"""
+        if self._pad_frame is None:
+            return None
+        return PAD_COLORS[self._pad_frame[row * 8 + col]]
+    
+    def _invalidate_pad_frame(self):
+        """Forget what the pads show so the next refresh repaints all 64"""
+        with self._pad_lock:
+            self._pad_frame = None
+            self._pad_state_key = None
+    
+    def _current_range_step(self):
+        """Step pad currently playing for the active track, or None when stopped"""
         if not self.sequencer.is_playing:
-            return False
+            return None
             
         # Map sequencer step to our adjusted step within the active range
         sequencer_step = self.sequencer.get_current_step(self.current_track)
-        pattern_length = self.sequencer.get_pattern_length(self.current_track)
         
         # If the pattern length is different from active range, we need to map steps
         active_range_length = self.selected_range_end - self.selected_range_start + 1
         range_position = sequencer_step % active_range_length
-        current_step_in_range = self.selected_range_start + range_position
-        
-        return current_step_in_range == step
+        return self.selected_range_start + range_position
     
-    def _has_notes_at_step(self, step):
+    def _get_pad_state_key(self):
+        """Snapshot of everything the pad frame depends on, or None if it can't be taken"""
+        is_playing = self.sequencer.is_playing
+        if self.tracks[self.current_track] is None:
+            notes = None
+        else:
+            notes = self.sequencer._internal_sequencer.tracks[self.current_track].notes
+            try:
+                # Pattern edits rebuild the notes tuple, so it doubles as a version
+                notes = (notes, len(notes))
+            except TypeError:
+                return None  # Mocked pattern, always rebuild
+        return (
+            is_playing,
+            self.sequencer.get_current_step(self.current_track) if is_playing else -1,
+            self.current_track,
+            self.held_step_pad,
+            self.selected_range_start,
+            self.selected_range_end,
+            self.keyboard_octave_offset,
+            frozenset(self.held_keyboard_pads),
+            notes,
+        )
+
+    def _uses_shared_keyboard_layout(self):
+        """True when the key colors in BASE_PAD_FRAME match this adapter's layout"""
+        return (self.white_key_positions is WHITE_KEY_PADS and
+                self.black_key_positions is BLACK_KEY_PADS and
+                self.disabled_key_positions is GAP_KEY_PADS)
+
+    def _collect_step_notes(self):
+        """Group the active track's notes by step, or None if the pattern can't be scanned"""
+        if self.tracks[self.current_track] is None:
+            return None
+
+        pattern = self.sequencer._internal_sequencer.tracks[self.current_track]
+        step_notes = {}
+        try:
+            for note in pattern.notes:
+                step_notes.setdefault(note.step, []).append(note)
+        except (TypeError, AttributeError):
+            # Mocked patterns fall back to per-step queries
+            return None
+        return step_notes
+
+    def _has_notes_at_step(self, step, step_notes=None):
         """Check if there are notes at this step for the active track (range-aware)"""
         if self.tracks[self.current_track] is None:
             return False
-        
+
+        if step_notes is not None:
+            return step in step_notes
+
         # Notes in the pattern are stored at their pattern-relative positions (0, 1, 2, etc.)
         # So we just need to check if there's a note at the given step in the pattern
         pattern = self.sequencer._internal_sequencer.tracks[self.current_track]
@@ -518,7 +647,7 @@ class Push2Adapter(UIAdapter):
             # If notes is a mock object, check if it has notes
             return hasattr(notes, '__len__') and len(notes) > 0
     
-    def _is_note_at_step_and_pad(self, step, pad_pos):
+    def _is_note_at_step_and_pad(self, step, pad_pos, step_notes=None):
         """Check if a specific note exists at step that corresponds to keyboard pad"""
         if self.tracks[self.current_track] is None:
             return False
@@ -531,8 +660,11 @@ class Push2Adapter(UIAdapter):
             return False
             
         # Get notes at this step
-        pattern = self.sequencer._internal_sequencer.tracks[self.current_track]
-        notes = pattern.get_notes_at_step(step)
+        if step_notes is not None:
+            notes = step_notes.get(step, ())
+        else:
+            pattern = self.sequencer._internal_sequencer.tracks[self.current_track]
+            notes = pattern.get_notes_at_step(step)
         
         # Check if any note matches the pad's note
         try:
@@ -547,18 +679,11 @@ class Push2Adapter(UIAdapter):
     def _update_octave_buttons(self):
         """Update octave button colors"""
         try:
-            if self.held_step_pad is not None:
-                if hasattr(push2_python.constants, 'BUTTON_OCTAVE_UP'):
-                    self.push.buttons.set_button_color(push2_python.constants.BUTTON_OCTAVE_UP, 'white')
-                if hasattr(push2_python.constants, 'BUTTON_OCTAVE_DOWN'):
-                    self.push.buttons.set_button_color(push2_python.constants.BUTTON_OCTAVE_DOWN, 'white')
-            else:
-                if hasattr(push2_python.constants, 'BUTTON_OCTAVE_UP'):
-                    self.push.buttons.set_button_color(push2_python.constants.BUTTON_OCTAVE_UP, DEFAULT_BUTTON_STATE)
-                if hasattr(push2_python.constants, 'BUTTON_OCTAVE_DOWN'):
-                    self.push.buttons.set_button_color(push2_python.constants.BUTTON_OCTAVE_DOWN, DEFAULT_BUTTON_STATE)
-        except Exception as e:
-            print(f"Octave button update error: {e}")
+            color = 'white' if self.held_step_pad is not None else DEFAULT_BUTTON_STATE
+            self.push.buttons.set_button_color(BUTTON_OCTAVE_UP, color)
+            self.push.buttons.set_button_color(BUTTON_OCTAVE_DOWN, color)
+        except Exception:
+            logger.exception("Octave button update error")
 
     def _update_delete_button(self):
         """Update delete button color"""
@@ -570,33 +695,28 @@ class Push2Adapter(UIAdapter):
                 if self._is_step_in_active_range(self.held_step_pad):
                     notes = self.sequencer._internal_sequencer.tracks[self.current_track].get_notes_at_step(self.held_step_pad)
                     if notes:
-                        if hasattr(push2_python.constants, 'BUTTON_DELETE'):
-                            self.push.buttons.set_button_color(push2_python.constants.BUTTON_DELETE, 'white')
+                        self.push.buttons.set_button_color(BUTTON_DELETE, 'white')
                     else:
-                        if hasattr(push2_python.constants, 'BUTTON_DELETE'):
-                            self.push.buttons.set_button_color(push2_python.constants.BUTTON_DELETE, DEFAULT_BUTTON_STATE)
+                        self.push.buttons.set_button_color(BUTTON_DELETE, DEFAULT_BUTTON_STATE)
                 else:
-                    if hasattr(push2_python.constants, 'BUTTON_DELETE'):
-                        self.push.buttons.set_button_color(push2_python.constants.BUTTON_DELETE, DEFAULT_BUTTON_STATE)
+                    self.push.buttons.set_button_color(BUTTON_DELETE, DEFAULT_BUTTON_STATE)
             else:
-                if hasattr(push2_python.constants, 'BUTTON_DELETE'):
-                    self.push.buttons.set_button_color(push2_python.constants.BUTTON_DELETE, DEFAULT_BUTTON_STATE)
-        except Exception as e:
-            print(f"Delete button update error: {e}")
+                self.push.buttons.set_button_color(BUTTON_DELETE, DEFAULT_BUTTON_STATE)
+        except Exception:
+            logger.exception("Delete button update error")
     
     def _init_cc_values_for_track(self):
         """Initialize CC values for current track"""
         if self.tracks[self.current_track] is not None:
             device = self.tracks[self.current_track]
-            self.cc_values = {}
-            cc_list = list(device.cc_mappings.items())[:8]
-            for i, (name, cc_num) in enumerate(cc_list):
-                self.cc_values[f"encoder_{i+1}"] = {
+            # Refill in place so the UI keeps sharing the same dict
+            self.cc_values.clear()
+            for encoder_key, (name, cc_num) in zip(CC_ENCODER_KEYS, islice(device.cc_mappings.items(), 8)):
+                self.cc_values[encoder_key] = {
                     "name": name,
                     "cc": cc_num,
                     "value": 64
                 }
-            self.ui.cc_values = self.cc_values
     
     def _execute_session_action(self):
         """Execute the selected session action"""
@@ -644,39 +764,54 @@ class Push2Adapter(UIAdapter):
         time.sleep(1.0)
         self.push.buttons.set_all_buttons_color(DEFAULT_BUTTON_STATE)
         time.sleep(0.5)
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_PLAY, 'white')
-        self.push.buttons.set_button_color(push2_python.constants.BUTTON_ADD_TRACK, 'white')
+        self.push.buttons.set_button_color(BUTTON_PLAY, 'white')
+        self.push.buttons.set_button_color(BUTTON_ADD_TRACK, 'white')
 
         # Init upper row buttons
-        for i in range(8):
-            button_name = self.UPPER_ROW_BUTTON_CONSTANTS[i]
-            if hasattr(push2_python.constants, button_name):
-                button_constant = getattr(push2_python.constants, button_name)
-                self.push.buttons.set_button_color(button_constant, DEFAULT_BUTTON_STATE)
+        for button in UPPER_ROW_BUTTONS:
+            self.push.buttons.set_button_color(button, DEFAULT_BUTTON_STATE)
 
         # Initialize pad colors
         self._update_pad_colors()
         self._update_track_buttons()
 
+        last_frame_version = None
+        last_send_time = 0.0
+        last_transport = None
         try:
             while True:
-                # Adaptive refresh rate
-                current_time = time.time()
-                if (current_time - self.last_encoder_time < 2.0 or 
-                    self.sequencer.is_playing or 
-                    self.device_selection_mode):
+                # Keep polling MIDI clock quickly while playing, otherwise just tick
+                if self.sequencer.is_playing or self.device_selection_mode:
                     update_interval = self.fast_refresh_rate
                 else:
                     update_interval = self.normal_refresh_rate
 
+                # Sleep until a handler reports a visible change or the tick expires
+                self._dirty.wait(timeout=update_interval)
+                self._dirty.clear()
+
                 # Poll MIDI input for clock messages
                 self.midi_output.poll_midi_input()
+
+                # External MIDI start/stop and clock tempo change the sequencer
+                # without publishing events, so pick those changes up here
+                transport = (self.sequencer.is_playing, self.sequencer.bpm)
+                if transport != last_transport:
+                    self._update_pad_colors()
+                    self.ui.invalidate()
+                    last_transport = transport
                 
-                # Update display
-                frame = self.ui.get_current_frame()
-                self.push.display.display_frame(frame, input_format=push2_python.constants.FRAME_FORMAT_RGB565)
+                now = time.monotonic()
+                keepalive_due = now - last_send_time >= DISPLAY_KEEPALIVE_INTERVAL
 
-                time.sleep(update_interval)
+                # Update display, skipping the USB transfer if the frame hasn't changed
+                # unless the keepalive is due; the cached frame is resent as-is
+                frame_version = self.ui.frame_version
+                if frame_version != last_frame_version or keepalive_due:
+                    frame = self.ui.get_current_frame()
+                    self.push.display.display_frame(frame, input_format=FRAME_FORMAT_RGB565)
+                    last_frame_version = frame_version
+                    last_send_time = now
 
         except KeyboardInterrupt:
             print("Shutting down...")
@@ -93,7 +93,7 @@ class SequencerEngine:
     def set_pattern_length(self, track: int, length: int, range_start: int = 0) -> None:
         """Set pattern length for specific track (1-64) with optional range positioning"""
         old_length = self.get_pattern_length(track)
-        old_range_start = getattr(self._internal_sequencer, '_range_starts', {})[track] if track in getattr(self._internal_sequencer, '_range_starts', {}) else 0
+        old_range_start = getattr(self._internal_sequencer, '_range_starts', {}).get(track, 0)
         self._internal_sequencer.set_pattern_length(track, length, range_start)
         
         if old_length != length or old_range_start != range_start:
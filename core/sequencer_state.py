@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Tuple, Optional
 from sequencer import Pattern, Note
 
 @dataclass(frozen=True)
@@ -11,11 +11,11 @@ class SequencerState:
     tracks: Tuple[Optional[Pattern], ...]
     current_track: int
     
-    def get_notes_at_step(self, track: int, step: int) -> List[Note]:
+    def get_notes_at_step(self, track: int, step: int) -> Tuple[Note, ...]:
         """Get notes at specific track and step"""
         if 0 <= track < len(self.tracks) and self.tracks[track] is not None:
             return self.tracks[track].get_notes_at_step(step)
-        return []
+        return ()
     
     def get_track_pattern(self, track: int) -> Optional[Pattern]:
         """Get pattern for specific track"""
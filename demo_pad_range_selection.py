@@ -47,8 +47,8 @@ def demonstrate_range_selection():
     pad2 = (2, 5)  # Step 21
     print(f"   - Pressing pads at {pad1} (step 2) and {pad2} (step 21)")
     
-    adapter.pressed_pads[pad1] = time.time()
-    adapter.pressed_pads[pad2] = time.time()
+    adapter.pressed_pads[pad1] = time.monotonic_ns()
+    adapter.pressed_pads[pad2] = time.monotonic_ns()
     adapter._process_range_selection()
     
     print(f"   - New range: {adapter.selected_range_start}-{adapter.selected_range_end}")
@@ -1,3 +1,4 @@
+import logging
 import push2_python
 from .transport_handler import TransportHandler
 from .track_handler import TrackHandler
@@ -6,6 +7,8 @@ from .clock_handler import ClockHandler
 from .encoder_handler import EncoderHandler
 from .session_handler import SessionHandler
 
+logger = logging.getLogger(__name__)
+
 class ButtonManager:
     def __init__(self, app):
         self.app = app
@@ -15,36 +18,15 @@ class ButtonManager:
         self.clock = ClockHandler(app)
         self.encoder = EncoderHandler(app)
         self.session = SessionHandler(app)
-        
-    def handle_button_press(self, button_name):
-        """Route button presses to appropriate handlers"""
-        print(f"Button pressed: '{button_name}'")
-        
-        # Handle session mode buttons first
-        if self.app.session_mode:
-            session_handlers = {
-                push2_python.constants.BUTTON_UPPER_ROW_1: self.session.handle_open_project,
-                push2_python.constants.BUTTON_UPPER_ROW_2: self.session.handle_save_project,
-                push2_python.constants.BUTTON_UPPER_ROW_3: self.session.handle_save_new_project,
-                push2_python.constants.BUTTON_UPPER_ROW_8: self.session.handle_confirm_session_action,
-            }
-            session_handler = session_handlers.get(button_name)
-            if session_handler:
-                session_handler()
-                return True
-        
-        # Track selection buttons
-        if 'Lower Row' in button_name:
-            try:
-                track_num = int(button_name.split()[-1]) - 1
-                if 0 <= track_num < 8 and self.app.tracks[track_num] is not None:
-                    self.track.handle_track_selection(track_num)
-            except (ValueError, IndexError):
-                print(f"Invalid track button: {button_name}")
-            return
-            
-        # Route other buttons
-        button_handlers = {
+
+        # Dispatch tables built once so each press is a single dict lookup
+        self._session_handlers = {
+            push2_python.constants.BUTTON_UPPER_ROW_1: self.session.handle_open_project,
+            push2_python.constants.BUTTON_UPPER_ROW_2: self.session.handle_save_project,
+            push2_python.constants.BUTTON_UPPER_ROW_3: self.session.handle_save_new_project,
+            push2_python.constants.BUTTON_UPPER_ROW_8: self.session.handle_confirm_session_action,
+        }
+        self._button_handlers = {
             push2_python.constants.BUTTON_PLAY: self.transport.handle_play,
             push2_python.constants.BUTTON_STOP: self.transport.handle_stop,
             push2_python.constants.BUTTON_MUTE: self.track.handle_mute,
@@ -54,20 +36,42 @@ class ButtonManager:
             push2_python.constants.BUTTON_METRONOME: self.clock.handle_metronome_button,
             push2_python.constants.BUTTON_SESSION: self.session.handle_session_button,
         }
-        
-        handler = button_handlers.get(button_name)
+        self._track_buttons = {
+            getattr(push2_python.constants, f'BUTTON_LOWER_ROW_{i + 1}'): i for i in range(8)
+        }
+
+    def handle_button_press(self, button_name):
+        """Route button presses to appropriate handlers"""
+        logger.debug("Button pressed: '%s'", button_name)
+
+        # Handle session mode buttons first
+        if self.app.session_mode:
+            session_handler = self._session_handlers.get(button_name)
+            if session_handler:
+                session_handler()
+                return True
+
+        # Track selection buttons
+        track_num = self._track_buttons.get(button_name)
+        if track_num is not None:
+            if self.app.tracks[track_num] is not None:
+                self.track.handle_track_selection(track_num)
+            return True
+
+        # Route other buttons
+        handler = self._button_handlers.get(button_name)
         if handler:
             handler()
         else:
             # Handle remaining buttons in app (octave, session, etc.)
             return False  # Indicates button not handled
         return True  # Indicates button was handled
-        
+
     def handle_button_release(self, button_name):
         """Handle button releases"""
-        if 'Lower Row' in button_name:
+        if button_name in self._track_buttons:
             self.track.handle_track_release()
-            
+
     def handle_encoder_rotation(self, encoder_name, increment):
         """Route encoder rotations to encoder handler"""
         return self.encoder.handle_encoder_rotation(encoder_name, increment)
@@ -1,6 +1,23 @@
+import logging
 import push2_python
 import time
 
+logger = logging.getLogger(__name__)
+
+def _clamp_add(value, increment, lo, hi):
+    """Add an encoder increment to value, clamped to [lo, hi]"""
+    value += increment
+    return lo if value < lo else hi if value > hi else value
+
+def _accumulate(accumulator, increment, threshold):
+    """Accumulate encoder detents; returns (accumulator, direction) with direction 0 until threshold"""
+    accumulator += increment
+    if accumulator >= threshold:
+        return 0, 1
+    if accumulator <= -threshold:
+        return 0, -1
+    return accumulator, 0
+
 class EncoderHandler:
     def __init__(self, app):
         self.app = app
@@ -53,18 +70,16 @@ class EncoderHandler:
         
     def _handle_tempo_encoder(self, increment):
         """Handle tempo encoder rotation"""
-        new_bpm = max(60, min(200, self.app.sequencer.bpm + increment))
+        new_bpm = _clamp_add(self.app.sequencer.bpm, increment, 60, 200)
         if new_bpm != self.app.sequencer.bpm:
             self.app.sequencer.set_bpm(new_bpm)
-            print(f"BPM: {new_bpm}")
+            logger.debug("BPM: %s", new_bpm)
             
     def _handle_device_selection_encoder(self, increment):
         """Handle device selection encoder"""
-        self.app.encoder_accumulator += increment
-        if abs(self.app.encoder_accumulator) >= self.app.encoder_threshold:
-            direction = 1 if self.app.encoder_accumulator > 0 else -1
-            self.app.encoder_accumulator = 0
-            
+        self.app.encoder_accumulator, direction = _accumulate(
+            self.app.encoder_accumulator, increment, self.app.encoder_threshold)
+        if direction:
             device_count = self.app.device_manager.get_device_count()
             if device_count > 0:
                 self.app.device_selection_index = (self.app.device_selection_index + direction) % device_count
@@ -75,8 +90,7 @@ class EncoderHandler:
         if self.app.device_selection_mode:
             device = self.app.device_manager.get_device_by_index(self.app.device_selection_index)
             if device:
-                new_channel = max(1, min(16, device.channel + increment))
-                device.channel = new_channel
+                device.channel = _clamp_add(device.channel, increment, 1, 16)
                 self.app.last_encoder_time = time.time()
                 
     def _handle_clock_selection_encoder(self, increment):
@@ -92,13 +106,13 @@ class EncoderHandler:
         if project_count > 0:
             self.app.session_project_index = (self.app.session_project_index + increment) % project_count
             self.app.last_encoder_time = time.time()
-            print(f"Project selection: {self.app.session_project_index}")
+            logger.debug("Project selection: %d", self.app.session_project_index)
             
     def _handle_cc_encoder(self, encoder_name, increment):
         """Handle CC encoder rotation"""
         if encoder_name in self.app.cc_values:
             cc_info = self.app.cc_values[encoder_name]
-            new_value = max(0, min(127, cc_info["value"] + increment))
+            new_value = _clamp_add(cc_info["value"], increment, 0, 127)
             cc_info["value"] = new_value
 
             # Send CC message
@@ -106,6 +120,4 @@ class EncoderHandler:
                 device = self.app.tracks[self.app.current_track]
                 self.app.midi_output.send_cc(device.channel, cc_info["cc"], new_value, device.port)
 
-            # Update UI reference and trigger fast display update
-            self.app.ui.cc_values = self.app.cc_values
             self.app.last_encoder_time = time.time()
\ No newline at end of file
@@ -10,6 +10,9 @@ except (ImportError, OSError) as e:
     import mock_midi as mido
     MIDI_AVAILABLE = False
 
+# Upper bound on prebuilt messages; live keyboard velocities would otherwise grow it forever
+MAX_CACHED_MESSAGES = 1024
+
 class MidiOutput:
     def __init__(self):
         self.output_ports = {}  # Dictionary of port_name -> mido output port
@@ -18,6 +21,8 @@ class MidiOutput:
         self.sequencer = None  # Will be set by sequencer
         self.clock_sources = []  # Available clock sources
         self.selected_clock_source = None
+        # Built messages keyed by type and fields; patterns replay the same few notes
+        self._messages = {}
         self.using_mock_midi = not MIDI_AVAILABLE
         self._scan_ports()
         self._setup_midi_input()
@@ -138,16 +143,29 @@ class MidiOutput:
                 port.close()
             self.output_ports.clear()
             
+    def _cache_message(self, key, msg_type, **fields):
+        """Build a message and keep it under key, starting over once the cache is full"""
+        if len(self._messages) >= MAX_CACHED_MESSAGES:
+            self._messages.clear()
+        msg = self._messages[key] = mido.Message(msg_type, **fields)
+        return msg
+    
     def send_note_on(self, channel: int, note: int, velocity: int, port_name: Optional[str] = None):
         target_ports = [self.output_ports[port_name]] if port_name and port_name in self.output_ports else self.output_ports.values()
-        msg = mido.Message('note_on', channel=channel-1, note=note, velocity=velocity)
+        key = ('note_on', channel, note, velocity)
+        msg = self._messages.get(key)
+        if msg is None:
+            msg = self._cache_message(key, 'note_on', channel=channel-1, note=note, velocity=velocity)
         for port in target_ports:
             port.send(msg)
 
             
     def send_note_off(self, channel: int, note: int, port_name: Optional[str] = None):
         target_ports = [self.output_ports[port_name]] if port_name and port_name in self.output_ports else self.output_ports.values()
-        msg = mido.Message('note_off', channel=channel-1, note=note, velocity=0)
+        key = ('note_off', channel, note)
+        msg = self._messages.get(key)
+        if msg is None:
+            msg = self._cache_message(key, 'note_off', channel=channel-1, note=note, velocity=0)
         for port in target_ports:
             port.send(msg)
             
@@ -158,17 +176,23 @@ class MidiOutput:
             port.send(msg)
 
     def send_clock(self):
-        msg = mido.Message('clock')
+        msg = self._messages.get('clock')
+        if msg is None:
+            msg = self._cache_message('clock', 'clock')
         for port in self.output_ports.values():
             port.send(msg)
 
             
     def send_start(self):
-        msg = mido.Message('start')
+        msg = self._messages.get('start')
+        if msg is None:
+            msg = self._cache_message('start', 'start')
         for port in self.output_ports.values():
             port.send(msg)
             
     def send_stop(self):
-        msg = mido.Message('stop')
+        msg = self._messages.get('stop')
+        if msg is None:
+            msg = self._cache_message('stop', 'stop')
         for port in self.output_ports.values():
             port.send(msg)
@@ -51,14 +51,19 @@ class MockMidiInput:
             if self.callback:
                 self.callback(message)
 
+# Port names are fixed, so keep them as module constants
+OUTPUT_NAMES = ("Mock MIDI Out 1", "Mock MIDI Out 2", "Test Device")
+INPUT_NAMES = ("Mock MIDI In 1", "Mock Clock Source")
+
 # Mock mido module functions
 def get_output_names():
     """Return mock MIDI output port names"""
-    return ["Mock MIDI Out 1", "Mock MIDI Out 2", "Test Device"]
+    # Fresh list like mido's: callers such as DynamicDeviceManager append to it
+    return list(OUTPUT_NAMES)
 
 def get_input_names():
     """Return mock MIDI input port names"""
-    return ["Mock MIDI In 1", "Mock Clock Source"]
+    return list(INPUT_NAMES)
 
 def open_output(name):
     """Return mock MIDI output port"""
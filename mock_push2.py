@@ -16,6 +16,7 @@ class MockPush2:
         
         # Mock pad methods
         self.pads.set_pad_color = Mock()
+        self.pads.set_pads_color = Mock()
         self.pads.set_all_pads_to_black = Mock()
         
         # Mock display methods
@@ -102,6 +103,11 @@ def on_encoder_rotated():
         return func
     return decorator
 
+def on_midi_connected():
+    def decorator(func):
+        return func
+    return decorator
+
 # Module-level exports
 Push2 = MockPush2
 constants = MockConstants()
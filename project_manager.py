@@ -88,12 +88,10 @@ class ProjectManager:
                         self.app.sequencer.set_track_device(track_idx, device)
                 
                 # Load notes
-                for note_data in track_data["notes"]:
-                    self.app.sequencer._internal_sequencer.tracks[track_idx].add_note(
-                        note_data["step"],
-                        note_data["note"],
-                        note_data["velocity"]
-                    )
+                self.app.sequencer._internal_sequencer.tracks[track_idx].add_notes(
+                    (note_data["step"], note_data["note"], note_data["velocity"])
+                    for note_data in track_data["notes"]
+                )
             
             # Set current track
             self.app.current_track = project_data.get("current_track", 0)
@@ -122,7 +120,7 @@ class ProjectManager:
         # Clear all tracks
         for i in range(8):
             self.app.tracks[i] = None
-            self.app.sequencer._internal_sequencer.tracks[i].notes.clear()
+            self.app.sequencer._internal_sequencer.tracks[i].clear()
             
         # Reset to defaults
         self.app.current_track = 0
@@ -1,46 +1,89 @@
+import logging
 import time
 import threading
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Slotted: a Note is created on every pad press
+@dataclass(slots=True)
 class Note:
     step: int
     note: int
     velocity: int
 
+_NO_NOTES = ()  # Shared result for empty steps
+
 class Pattern:
+    __slots__ = ('length', 'current_step', '_notes_by_step', '_notes')
+
     def __init__(self, length: int = 32):  # Changed default to 32 steps
         self.length = max(1, min(64, length))  # Clamp to 1-64
-        self.notes: List[Note] = []
+        # Sparse storage: at most one note per step, keyed by step. Each note is kept
+        # as the 1-tuple get_notes_at_step returns, so lookups allocate nothing.
+        self._notes_by_step: Dict[int, Tuple[Note]] = {}
+        self._notes: Optional[Tuple[Note, ...]] = None  # Cached view of _notes_by_step
         self.current_step = 0
 
+    @property
+    def notes(self) -> Tuple[Note, ...]:
+        """All notes in the order they were added; rebuilt only after an edit"""
+        if self._notes is None:
+            self._notes = tuple(note for note, in self._notes_by_step.values())
+        return self._notes
+
+    @notes.setter
+    def notes(self, notes):
+        self._notes_by_step = {note.step: (note,) for note in notes}
+        self._notes = None
+
     def add_note(self, step: int, note: int, velocity: int = 100):
         # Only add note if step is within pattern length
         if 0 <= step < self.length:
-            # Remove existing note at this step if any
-            self.notes = [n for n in self.notes if n.step != step]
-            # Add new note
-            self.notes.append(Note(step, note, velocity))
+            # Replace any existing note at this step, moving it to the end
+            self._notes_by_step.pop(step, None)
+            self._notes_by_step[step] = (Note(step, note, velocity),)
+            self._notes = None
+
+    def add_notes(self, notes: Iterable[Tuple[int, int, int]]):
+        """Add (step, note, velocity) triples in one call, with the same rules as add_note"""
+        notes_by_step = self._notes_by_step
+        for step, note, velocity in notes:
+            if 0 <= step < self.length:
+                notes_by_step.pop(step, None)
+                notes_by_step[step] = (Note(step, note, velocity),)
+        self._notes = None
 
     def remove_note(self, step: int):
-        self.notes = [n for n in self.notes if n.step != step]
+        if self._notes_by_step.pop(step, None) is not None:
+            self._notes = None
 
-    def get_notes_at_step(self, step: int) -> List[Note]:
-        return [n for n in self.notes if n.step == step]
+    def get_notes_at_step(self, step: int) -> Tuple[Note, ...]:
+        return self._notes_by_step.get(step, _NO_NOTES)
     
-    def get_absolute_notes_at_step(self, absolute_step: int, range_start: int = 0) -> List[Note]:
+    def get_absolute_notes_at_step(self, absolute_step: int, range_start: int = 0) -> Tuple[Note, ...]:
         """Get notes at absolute step position (considering range)"""
         # Convert absolute step to pattern-relative step
         relative_step = absolute_step - range_start
         if 0 <= relative_step < self.length:
-            return [n for n in self.notes if n.step == relative_step]
-        return []
+            return self.get_notes_at_step(relative_step)
+        return _NO_NOTES
+
+    def count_notes_in_range(self, start: int, end: int) -> int:
+        """Number of steps from start to end (inclusive) that hold a note"""
+        return sum(1 for step in self._notes_by_step if start <= step <= end)
 
     def clear_step(self, step: int):
-        self.notes = [n for n in self.notes if n.step != step]
+        self.remove_note(step)
+
+    def clear(self):
+        self._notes_by_step.clear()
+        self._notes = None
 
 class Sequencer:
+    EXTERNAL_SYNC_POLL_INTERVAL = 0.01  # Seconds between note-off checks when clocked externally
+
     def __init__(self, midi_output, bpm: int = 120):
         self.midi_output = midi_output
         self.bpm = bpm
@@ -94,7 +137,7 @@ class Sequencer:
         """Set pattern length for specific track (1-64) with optional range positioning"""
         if 0 <= track < 8:
             old_length = self.tracks[track].length
-            old_range_start = getattr(self, '_range_starts', {})[track] if track in getattr(self, '_range_starts', {}) else 0
+            old_range_start = getattr(self, '_range_starts', {}).get(track, 0)
             new_length = max(1, min(64, length))
             
             # Initialize preserved notes storage and range tracking if not exists
@@ -105,7 +148,8 @@ class Sequencer:
             if not hasattr(self, '_range_starts'):
                 self._range_starts = {}
                 
-            print(f"Track {track}: Changing from range {old_range_start}-{old_range_start+old_length-1} to {range_start}-{range_start+new_length-1}")
+            logger.debug("Track %d: Changing from range %d-%d to %d-%d", track, old_range_start,
+                         old_range_start + old_length - 1, range_start, range_start + new_length - 1)
             
             if new_length != old_length or range_start != old_range_start:
                 # RANGE CHANGE: Handle note reindexing
@@ -155,7 +199,8 @@ class Sequencer:
                 self._range_starts[track] = range_start
                 self.tracks[track].length = new_length
                 
-                print(f"Track {track}: Range change complete - {len(active_notes)} active, {len(preserved)} preserved, {restored_count} restored")
+                logger.debug("Track %d: Range change complete - %d active, %d preserved, %d restored",
+                             track, len(active_notes), len(preserved), restored_count)
             else:
                 # Same range - no change needed
                 self._range_starts[track] = range_start
@@ -187,18 +232,19 @@ class Sequencer:
                     
     def handle_midi_clock(self):
         """Handle incoming MIDI clock pulse"""
-        current_time = time.time()
+        # Same monotonic clock as the play loop, so wall-clock jumps can't skew the BPM
+        current_time = time.monotonic()
         self._clock_count += 1
         
-        # Debug: Print every 96th clock (whole note) to reduce noise
+        # Debug: log every 96th clock (whole note) to reduce noise
         if self._clock_count % 96 == 0:
-            print(f"External sync: BPM {self.bpm}")
+            logger.debug("External sync: BPM %s", self.bpm)
         
         # Forward clock to all devices
         self.midi_output.send_clock()
         
         # Calculate BPM from clock timing (24 clocks per quarter note)
-        if self._last_clock_time:
+        if self._last_clock_time is not None:
             self._clock_times.append(current_time - self._last_clock_time)
             if len(self._clock_times) > 24:
                 self._clock_times.pop(0)
@@ -209,7 +255,7 @@ class Sequencer:
                 new_bpm = round(60.0 / quarter_note_time, 1)
                 if abs(new_bpm - self.bpm) > 0.1:  # Only update if significant change
                     self.bpm = new_bpm
-                    print(f"BPM updated to: {self.bpm}")
+                    logger.debug("BPM updated to: %s", self.bpm)
                 
         self._last_clock_time = current_time
         
@@ -219,7 +265,7 @@ class Sequencer:
             
     def handle_midi_start(self):
         """Handle incoming MIDI start"""
-        print("MIDI Start received - switching to external sync")
+        logger.debug("MIDI Start received - switching to external sync")
         self._clock_count = 0
         self.current_steps = [0] * 8  # Reset all track step counters
         self.external_sync = True
@@ -227,7 +273,7 @@ class Sequencer:
         
     def handle_midi_stop(self):
         """Handle incoming MIDI stop"""
-        print("MIDI Stop received - switching to internal sync")
+        logger.debug("MIDI Stop received - switching to internal sync")
         self.external_sync = False
         self.stop()
 
@@ -249,6 +295,10 @@ class Sequencer:
         if self.is_playing:
             self.is_playing = False
             self._stop_event.set()
+            # Let the play thread finish its step first so _active_notes can't
+            # change while it is flushed below
+            if self._thread:
+                self._thread.join()
 
             # Send note-off for all active notes
             for channel, note, port_name in self._active_notes:
@@ -257,17 +307,16 @@ class Sequencer:
 
             # Send stop only to devices that want transport messages
             self._send_transport_to_active_devices('stop')
-            if self._thread:
-                self._thread.join()
 
     def _play_loop(self):
-        step_duration = 60.0 / (self.bpm * 4)  # 16th notes
-        next_step_time = time.time()
+        # Steps are scheduled in logical time: each one is due a 16th note after the
+        # previous step's due time, not after whenever that step actually ran
+        next_step_time = time.monotonic()
         self.note_off_time = None
         self.current_step_notes = set()
 
         while not self._stop_event.is_set():
-            current_time = time.time()
+            current_time = time.monotonic()
 
             # Send note-off for previous step's notes
             if self.note_off_time and current_time >= self.note_off_time:
@@ -279,52 +328,77 @@ class Sequencer:
 
             # Check if it's time for the next step (only for internal timing)
             if not self.external_sync and current_time >= next_step_time:
-                self._trigger_step()
-                next_step_time += step_duration
-
-            time.sleep(0.01)  # Small sleep to prevent CPU spinning
+                self._trigger_step(next_step_time)
+                next_step_time += 60.0 / (self.bpm * 4)  # Follows tempo changes while playing
+
+            # Sleep until the next scheduled event rather than polling; the
+            # stop event wakes us immediately. With external sync, steps come
+            # from the clock thread, so fall back to a short poll for note-offs.
+            if self.external_sync:
+                deadline = current_time + self.EXTERNAL_SYNC_POLL_INTERVAL
+            else:
+                deadline = next_step_time
+            if self.note_off_time is not None:
+                deadline = min(deadline, self.note_off_time)
+            self._stop_event.wait(max(0.0, deadline - time.monotonic()))
             
-    def _trigger_step(self):
-        """Trigger notes for current step - advance each track independently"""
+    def _trigger_step(self, step_time: Optional[float] = None):
+        """Trigger notes for current step - advance each track independently
+
+        step_time is the monotonic time the step was due; note-offs are scheduled
+        from it so wake-up latency doesn't shift the gate. Defaults to now.
+        """
         # Send note-off for previous step's notes first
         for channel, note, port_name in self.current_step_notes:
             self.midi_output.send_note_off(channel, note, port_name)
             self._active_notes.discard((channel, note, port_name))
         self.current_step_notes.clear()
         
-        # Play notes for all tracks at their current steps
+        # Play notes for all tracks at their current steps. Look up the optional
+        # per-track state once per tick rather than once per track.
+        app_ref = getattr(self, 'app_ref', None)
+        range_starts = getattr(self, '_range_starts', {})
+        track_ports = getattr(self, '_track_ports', {})
+        send_note_on = self.midi_output.send_note_on
+        log_notes = logger.isEnabledFor(logging.DEBUG)
         total_notes = 0
         for track_idx, track_pattern in enumerate(self.tracks):
             # Check if track should be audible
-            if hasattr(self, 'app_ref') and self.app_ref and not self.app_ref._is_track_audible(track_idx):
+            if app_ref and not app_ref._is_track_audible(track_idx):
                 continue
                 
             # Use this track's current step position
             current_track_step = self.current_steps[track_idx]
             
             # Get range start for this track
-            range_start = getattr(self, '_range_starts', {})[track_idx] if track_idx in getattr(self, '_range_starts', {}) else 0
+            range_start = range_starts.get(track_idx, 0)
             
             # Calculate absolute step position in the original 32-step space
             absolute_step = range_start + current_track_step
             
             # Get notes at this absolute position
             notes_at_step = track_pattern.get_absolute_notes_at_step(absolute_step, range_start)
+            if not notes_at_step:
+                continue
             total_notes += len(notes_at_step)
 
+            channel = self.track_channels[track_idx]
+            port_name = track_ports.get(track_idx)
             for note in notes_at_step:
-                channel = self.track_channels[track_idx]
-                port_name = getattr(self, '_track_ports', {}).get(track_idx)
-                print(f"Track {track_idx} Step {current_track_step} (abs {absolute_step}): Playing note {note.note} on channel {channel} port {port_name}")
-                self.midi_output.send_note_on(channel, note.note, note.velocity, port_name)
+                if log_notes:
+                    logger.debug("Track %d Step %d (abs %d): Playing note %d on channel %d port %s",
+                                 track_idx, current_track_step, absolute_step, note.note, channel, port_name)
+                send_note_on(channel, note.note, note.velocity, port_name)
                 self._active_notes.add((channel, note.note, port_name))
                 self.current_step_notes.add((channel, note.note, port_name))
 
         # Schedule note-off for end of this step
         step_duration = 60.0 / (self.bpm * 4)
-        self.note_off_time = time.time() + step_duration * 0.9
+        if step_time is None:
+            step_time = time.monotonic()
+        self.note_off_time = step_time + step_duration * 0.9
 
-        print(f"Polyrhythmic trigger: {total_notes} total notes across all tracks")
+        logger.debug("Polyrhythmic trigger: %d total notes across all tracks", total_notes)
         
         # Store previous steps before advancing
         previous_steps = self.current_steps.copy()
@@ -1,45 +1,48 @@
 import pytest
 from unittest.mock import Mock, MagicMock, patch
-import sys
 import os
+import sys
+import weakref
+
+# Our comprehensive mocks, imported once alongside the fixtures that install them
+import mock_midi
+import mock_push2
+
+# Install the Push2 mock before any test module imports handlers or adapters,
+# so collection never loads the real push2_python driver
+sys.modules['push2_python'] = mock_push2
+sys.modules['push2_python.constants'] = mock_push2.constants
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """With -n auto, leave two cores free for the rest of the machine"""
+    return max(1, (os.cpu_count() or 1) - 2)
 
 # Force mock MIDI usage in tests to avoid ALSA dependencies
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def mock_mido():
-    """Automatically mock mido for all tests to avoid ALSA dependencies"""
-    # Import our comprehensive mocks
-    import mock_midi
-    import mock_push2
-    
-    with patch.dict('sys.modules', {
-        'mido': mock_midi,
-        'push2_python': mock_push2,
-        'push2_python.constants': mock_push2.constants
-    }):
+    """Mock mido once for the whole session to avoid ALSA dependencies"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, 'mido', mock_midi)
         # Patch mido functions in midi_output
-        with patch('midi_output.mido', mock_midi):
-            with patch('midi_output.MIDI_AVAILABLE', False):
-                yield
+        mp.setattr('midi_output.mido', mock_midi)
+        mp.setattr('midi_output.MIDI_AVAILABLE', False)
+        yield
+
+# send_* methods are auto-created by Mock, so only state needs configuring
+MIDI_OUTPUT_MOCK_CONFIG = {
+    'available_ports': ['Test Port 1', 'Test Port 2'],
+    'clock_sources': ['Internal', 'Test Clock'],
+    'selected_clock_source': 'Internal',
+    'using_mock_midi': True,
+    'connect.return_value': True,
+}
 
 @pytest.fixture
 def mock_midi_output():
     """Mock MIDI output for testing"""
-    mock = Mock()
-    mock.output_ports = {}
-    mock.available_ports = ['Test Port 1', 'Test Port 2']
-    mock.clock_sources = ['Internal', 'Test Clock']
-    mock.selected_clock_source = 'Internal'
-    mock.using_mock_midi = True
-    mock.connect.return_value = True
-    mock.send_note_on = Mock()
-    mock.send_note_off = Mock()
-    mock.send_cc = Mock()
-    mock.send_start = Mock()
-    mock.send_stop = Mock()
-    mock.send_clock = Mock()
+    mock = Mock(**MIDI_OUTPUT_MOCK_CONFIG)
+    mock.output_ports = {}  # Fresh dict per test
     return mock
 
 @pytest.fixture
@@ -60,35 +63,34 @@ def mock_push():
     mock.display = Mock()
     return mock
 
-@pytest.fixture(autouse=True)
-def cleanup_sequencers():
-    """Automatically cleanup any running sequencers after each test"""
-    # Store references to any sequencers created during test
-    sequencers = []
+@pytest.fixture(scope="session")
+def live_sequencers(mock_mido):
+    """Weak registry of every Sequencer constructed during the session"""
+    from sequencer import Sequencer
+    sequencers = weakref.WeakSet()
+    original_init = Sequencer.__init__
     
-    # Monkey patch Sequencer.__init__ to track instances
-    original_init = None
+    def tracking_init(self, *args, **kwargs):
+        sequencers.add(self)
+        return original_init(self, *args, **kwargs)
+    
+    Sequencer.__init__ = tracking_init
     try:
-        from sequencer import Sequencer
-        original_init = Sequencer.__init__
-        
-        def tracking_init(self, *args, **kwargs):
-            sequencers.append(self)
-            return original_init(self, *args, **kwargs)
-        
-        Sequencer.__init__ = tracking_init
-        
-        yield  # Run the test
-        
+        yield sequencers
     finally:
-        # Cleanup: stop all sequencers that might still be running
-        for seq in sequencers:
-            try:
-                if hasattr(seq, 'is_playing') and seq.is_playing:
-                    seq.stop()
-            except:
-                pass  # Ignore cleanup errors
-        
-        # Restore original __init__
-        if original_init:
-            Sequencer.__init__ = original_init
\ No newline at end of file
+        Sequencer.__init__ = original_init
+
+@pytest.fixture(autouse=True)
+def cleanup_sequencers(live_sequencers):
+    """Automatically cleanup any running sequencers after each test"""
+    yield  # Run the test
+    
+    # Cleanup: stop all sequencers that might still be running
+    for seq in list(live_sequencers):
+        try:
+            # getattr: a constructor that raised leaves a half-built instance behind
+            if getattr(seq, 'is_playing', False):
+                seq.stop()
+        except Exception:
+            pass  # Ignore cleanup errors
+    live_sequencers.clear()
@@ -1,33 +1,27 @@
 import pytest
 import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.sequencer_engine import SequencerEngine
 from core.sequencer_event_bus import EventType, SequencerEvent
-from midi_output import MidiOutput
 
-def test_sequencer_engine_creation():
+def test_sequencer_engine_creation(mock_midi_output):
     """Test sequencer engine can be created"""
-    midi_output = MidiOutput()
-    engine = SequencerEngine(midi_output)
+    engine = SequencerEngine(mock_midi_output)
     assert engine.bpm == 120
     assert engine.is_playing == False
     assert engine.current_step == 0
 
-def test_sequencer_state_snapshot():
+def test_sequencer_state_snapshot(mock_midi_output):
     """Test state snapshots work"""
-    midi_output = MidiOutput()
-    engine = SequencerEngine(midi_output)
+    engine = SequencerEngine(mock_midi_output)
     state = engine.get_state()
     assert state.bpm == 120
     assert state.is_playing == False
     assert state.current_step == 0
 
-def test_event_bus_subscription():
+def test_event_bus_subscription(mock_midi_output):
     """Test event bus pub/sub works"""
-    midi_output = MidiOutput()
-    engine = SequencerEngine(midi_output)
+    engine = SequencerEngine(mock_midi_output)
     
     events_received = []
     def on_event(event):
@@ -39,19 +33,17 @@ def test_event_bus_subscription():
     assert len(events_received) == 1
     assert events_received[0].data['bpm'] == 140
 
-def test_add_note():
+def test_add_note(mock_midi_output):
     """Test adding notes works"""
-    midi_output = MidiOutput()
-    engine = SequencerEngine(midi_output)
+    engine = SequencerEngine(mock_midi_output)
     
     engine.add_note(0, 0, 60, 100)
     notes = engine.get_track_notes(0)
     assert len(notes) > 0
 
-def test_play_stop():
+def test_play_stop(mock_midi_output):
     """Test play/stop functionality"""
-    midi_output = MidiOutput()
-    engine = SequencerEngine(midi_output)
+    engine = SequencerEngine(mock_midi_output)
     
     events_received = []
     def on_event(event):
@@ -75,9 +67,4 @@ def test_play_stop():
             engine.stop()
 
 if __name__ == '__main__':
-    test_sequencer_engine_creation()
-    test_sequencer_state_snapshot()
-    test_event_bus_subscription()
-    test_add_note()
-    test_play_stop()
-    print("✅ All Phase 1 tests passed!")
\ No newline at end of file
+    sys.exit(pytest.main([__file__]))
@@ -3,69 +3,56 @@ from unittest.mock import Mock, patch, mock_open
 import json
 from dynamic_device_manager import DynamicDeviceManager, MidiDevice
 
+@pytest.fixture(scope="module")
+def manager(request):
+    """DynamicDeviceManager built once per (ports, cc_library_json) parameter set"""
+    ports, cc_json = request.param
+    with patch('dynamic_device_manager.mido') as mock_mido, \
+         patch('builtins.open', mock_open(read_data=cc_json)):
+        mock_mido.get_output_names.return_value = list(ports)
+        return DynamicDeviceManager()
+
+TEST_DEVICE_PORTS = (['Test Device Port', 'Another Port'], '{"Test Device": {"cc_mappings": {"Volume": 7}}}')
+GENERIC_PORT = (['Generic Port'], '{}')
+SYNTH_PORT = (['My Synth v2.1'], '{"Synth": {"cc_mappings": {"Filter": 74}}}')
+THREE_PORTS = (['Port1', 'Port2', 'Port3'], '{}')
+
 class TestDynamicDeviceManager:
-    @patch('dynamic_device_manager.mido')
-    @patch('builtins.open', new_callable=mock_open, read_data='{"Test Device": {"cc_mappings": {"Volume": 7}}}')
-    def test_init(self, mock_file, mock_mido):
-        mock_mido.get_output_names.return_value = ['Test Device Port', 'Another Port']
-        
-        manager = DynamicDeviceManager()
-        
+    @pytest.mark.parametrize('manager', [TEST_DEVICE_PORTS], indirect=True)
+    def test_init(self, manager):
         assert len(manager.current_devices) == 3  # +1 for virtual port
         assert any(d.name == 'Test Device Port' for d in manager.current_devices)
         assert any(d.name == 'Push Sequencer Out' for d in manager.current_devices)
         
-    @patch('dynamic_device_manager.mido')
-    @patch('builtins.open', new_callable=mock_open, read_data='{}')
-    def test_init_no_cc_library(self, mock_file, mock_mido):
-        mock_mido.get_output_names.return_value = ['Generic Port']
-        
-        manager = DynamicDeviceManager()
-        
+    @pytest.mark.parametrize('manager', [GENERIC_PORT], indirect=True)
+    def test_init_no_cc_library(self, manager):
         assert len(manager.current_devices) == 2  # +1 for virtual port
         generic_device = next(d for d in manager.current_devices if d.name == 'Generic Port')
         assert generic_device.cc_mappings == {}
         
-    @patch('dynamic_device_manager.mido')
-    @patch('builtins.open', new_callable=mock_open, read_data='{"Synth": {"cc_mappings": {"Filter": 74}}}')
-    def test_fuzzy_matching(self, mock_file, mock_mido):
-        mock_mido.get_output_names.return_value = ['My Synth v2.1']
-        
-        manager = DynamicDeviceManager()
-        
+    @pytest.mark.parametrize('manager', [SYNTH_PORT], indirect=True)
+    def test_fuzzy_matching(self, manager):
         synth_device = next(d for d in manager.current_devices if 'Synth' in d.name)
         assert synth_device.name == 'My Synth v2.1'  # Name stays as port name
         assert synth_device.cc_mappings == {}  # CC library loading is mocked differently
         
-    @patch('dynamic_device_manager.mido')
-    @patch('builtins.open', new_callable=mock_open, read_data='{}')
-    def test_get_device_count(self, mock_file, mock_mido):
-        mock_mido.get_output_names.return_value = ['Port1', 'Port2', 'Port3']
-        
-        manager = DynamicDeviceManager()
-        
+    @pytest.mark.parametrize('manager', [THREE_PORTS], indirect=True)
+    def test_get_device_count(self, manager):
         assert manager.get_device_count() == 4  # +1 for virtual port
         
-    @patch('dynamic_device_manager.mido')
-    @patch('builtins.open', new_callable=mock_open, read_data='{}')
-    def test_get_device_by_index(self, mock_file, mock_mido):
-        mock_mido.get_output_names.return_value = ['Port1', 'Port2']
-        
-        manager = DynamicDeviceManager()
+    @pytest.mark.parametrize('manager', [THREE_PORTS], indirect=True)
+    def test_get_device_by_index(self, manager):
         device = manager.get_device_by_index(1)
         
         assert device.port == 'Port2'
         
-    @patch('dynamic_device_manager.mido')
-    @patch('builtins.open', new_callable=mock_open, read_data='{}')
-    def test_get_device_by_index_invalid(self, mock_file, mock_mido):
-        mock_mido.get_output_names.return_value = ['Port1']
-        
-        manager = DynamicDeviceManager()
+    @pytest.mark.parametrize('manager', [THREE_PORTS], indirect=True)
+    def test_get_device_by_index_invalid(self, manager):
         device = manager.get_device_by_index(5)
         
         assert device is None
         
+    # Mutates the manager, so it builds its own
     @patch('dynamic_device_manager.mido')
     @patch('builtins.open', new_callable=mock_open, read_data='{}')
     def test_refresh_devices(self, mock_file, mock_mido):
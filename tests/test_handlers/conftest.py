@@ -0,0 +1,94 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# Union of the plain state any handler reads; modules override it through APP_STATE
+DEFAULT_APP_STATE = {
+    'current_track': 0,
+    'tracks': [None] * 8,
+    'track_muted': [False] * 8,
+    'held_track_button': None,
+    'track_edit_mode': False,
+    'solo_mode': False,
+    'soloed_track': None,
+    'pad_states': {},
+    'cc_values': {},
+    'device_selection_mode': False,
+    'device_selection_index': 0,
+    'clock_selection_mode': False,
+    'clock_selection_index': 0,
+    'session_mode': False,
+    'session_action': None,
+    'session_project_index': 0,
+    'encoder_accumulator': 0,
+    'encoder_threshold': 13,
+    'last_encoder_time': 0,
+}
+
+# Collaborators and app callbacks that tests assert on get a fresh Mock each.
+# spec_set keeps attribute access to the names the handlers use and turns typos into errors.
+APP_MOCK_SPECS = {
+    'sequencer': ('bpm', 'set_bpm', 'is_playing', 'current_step', '_internal_sequencer',
+                  'play', 'stop', 'set_track_channel', 'set_track_device', 'set_track_port'),
+    'push': ('buttons', 'pads', 'display'),
+    'midi_output': ('clock_sources', 'connect', 'select_clock_source', 'send_cc'),
+    'device_manager': ('current_devices', 'get_device_count', 'get_device_by_index'),
+    'project_manager': ('list_projects',),
+    'event_bus': ('publish',),
+    '_update_track_buttons': (),
+    '_init_cc_values_for_track': (),
+    '_update_mute_solo_buttons': (),
+    '_update_pad_colors': (),
+    '_execute_session_action': (),
+}
+
+def _fresh(value):
+    """Copy mutable containers so one test's edits never reach the shared tables"""
+    if isinstance(value, dict):
+        return {key: _fresh(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_fresh(item) for item in value]
+    return value
+
+FROZEN_TIME = 1000.0
+
+@pytest.fixture(scope="module")
+def frozen_time(request):
+    """Freeze time.time in the test module's HANDLER_MODULE and return the frozen value
+
+    Module-scoped, so time.time stays real everywhere else.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(request.module.HANDLER_MODULE, 'time', SimpleNamespace(time=lambda: FROZEN_TIME))
+        yield FROZEN_TIME
+
+@pytest.fixture(autouse=True, scope="module")
+def stub_constants(request):
+    """Give the Push2 constants the test module's CONSTANTS values once for the whole module"""
+    import push2_python  # The mock installed by the top-level conftest
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in getattr(request.module, 'CONSTANTS', {}).items():
+            mp.setattr(push2_python.constants, name, value)
+        yield
+
+@pytest.fixture
+def mock_app_factory():
+    """Build an app namespace from DEFAULT_APP_STATE plus overrides
+
+    Dotted keys such as 'sequencer.bpm' configure the named collaborator Mock.
+    """
+    def make(**overrides):
+        app = SimpleNamespace(**{name: Mock(spec_set=spec) for name, spec in APP_MOCK_SPECS.items()})
+        for name, value in {**DEFAULT_APP_STATE, **overrides}.items():
+            head, _, rest = name.partition('.')
+            if rest:
+                getattr(app, head).configure_mock(**{rest: _fresh(value)})
+            else:
+                setattr(app, name, _fresh(value))
+        return app
+    return make
+
+@pytest.fixture
+def mock_app(mock_app_factory, request):
+    """App for handler tests, using the test module's APP_STATE when it has one"""
+    return mock_app_factory(**getattr(request.module, 'APP_STATE', {}))
@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import Mock
+from handlers import button_manager
+from handlers.button_manager import ButtonManager
+
+constants = button_manager.push2_python.constants
+
+# Overrides of the shared handler app state in conftest
+APP_STATE = {
+    'tracks': [Mock(), None, Mock(), None, None, None, None, None],
+}
+
+class TestButtonManager:
+    def test_track_button_selects_track(self, mock_app):
+        manager = ButtonManager(mock_app)
+        manager.track.handle_track_selection = Mock()
+
+        result = manager.handle_button_press(constants.BUTTON_LOWER_ROW_3)
+
+        assert result is True
+        manager.track.handle_track_selection.assert_called_once_with(2)
+
+    def test_track_button_ignores_empty_track(self, mock_app):
+        manager = ButtonManager(mock_app)
+        manager.track.handle_track_selection = Mock()
+
+        result = manager.handle_button_press(constants.BUTTON_LOWER_ROW_2)
+
+        assert result is True
+        manager.track.handle_track_selection.assert_not_called()
+
+    def test_track_button_release(self, mock_app):
+        manager = ButtonManager(mock_app)
+        manager.track.handle_track_release = Mock()
+
+        manager.handle_button_release(constants.BUTTON_LOWER_ROW_1)
+        manager.handle_button_release(constants.BUTTON_PLAY)
+
+        manager.track.handle_track_release.assert_called_once()
+
+    def test_session_buttons_only_in_session_mode(self, mock_app):
+        manager = ButtonManager(mock_app)
+
+        assert manager.handle_button_press(constants.BUTTON_UPPER_ROW_1) is False
+
+        mock_app.session_mode = True
+        assert manager.handle_button_press(constants.BUTTON_UPPER_ROW_1) is True
+        assert mock_app.session_action == 'open'
+
+    def test_unhandled_button(self, mock_app):
+        manager = ButtonManager(mock_app)
+
+        assert manager.handle_button_press(constants.BUTTON_OCTAVE_UP) is False
@@ -1,36 +1,34 @@
 import pytest
-from unittest.mock import Mock, patch
+from handlers import clock_handler
 from handlers.clock_handler import ClockHandler
 
+# Handler whose clock the shared frozen_time fixture freezes
+HANDLER_MODULE = clock_handler
+
+# Overrides of the shared handler app state in conftest
+APP_STATE = {
+    'midi_output.clock_sources': ['Internal', 'Clock1', 'Clock2'],
+}
+
+@pytest.fixture
+def handler(mock_app):
+    return ClockHandler(mock_app)
+
 class TestClockHandler:
-    @pytest.fixture
-    def mock_app(self):
-        app = Mock()
-        app.clock_selection_mode = False
-        app.clock_selection_index = 0
-        app.midi_output = Mock()
-        app.midi_output.clock_sources = ['Internal', 'Clock1', 'Clock2']
-        return app
-        
-    def test_handle_metronome_button_enable(self, mock_app):
-        handler = ClockHandler(mock_app)
-        
-        with patch('handlers.clock_handler.time.time', return_value=1000.0):
-            handler.handle_metronome_button()
-            
+    def test_handle_metronome_button_enable(self, mock_app, handler, frozen_time):
+        handler.handle_metronome_button()
+        
         assert mock_app.clock_selection_mode is True
-        assert mock_app.last_encoder_time == 1000.0
+        assert mock_app.last_encoder_time == frozen_time
         
-    def test_handle_metronome_button_disable(self, mock_app):
-        handler = ClockHandler(mock_app)
+    def test_handle_metronome_button_disable(self, mock_app, handler):
         mock_app.clock_selection_mode = True
         
         handler.handle_metronome_button()
         
         assert mock_app.clock_selection_mode is False
         
-    def test_handle_confirm_clock_selection_valid(self, mock_app):
-        handler = ClockHandler(mock_app)
+    def test_handle_confirm_clock_selection_valid(self, mock_app, handler):
         mock_app.clock_selection_mode = True
         mock_app.clock_selection_index = 1
         
@@ -39,8 +37,7 @@ class TestClockHandler:
         mock_app.midi_output.select_clock_source.assert_called_with('Clock1')
         assert mock_app.clock_selection_mode is False
         
-    def test_handle_confirm_clock_selection_invalid_index(self, mock_app):
-        handler = ClockHandler(mock_app)
+    def test_handle_confirm_clock_selection_invalid_index(self, mock_app, handler):
         mock_app.clock_selection_mode = True
         mock_app.clock_selection_index = 5  # Out of range
         
@@ -49,8 +46,7 @@ class TestClockHandler:
         mock_app.midi_output.select_clock_source.assert_not_called()
         assert mock_app.clock_selection_mode is False
         
-    def test_handle_confirm_clock_selection_no_sources(self, mock_app):
-        handler = ClockHandler(mock_app)
+    def test_handle_confirm_clock_selection_no_sources(self, mock_app, handler):
         mock_app.clock_selection_mode = True
         mock_app.midi_output.clock_sources = []
         
@@ -59,8 +55,7 @@ class TestClockHandler:
         mock_app.midi_output.select_clock_source.assert_not_called()
         assert mock_app.clock_selection_mode is False
         
-    def test_handle_confirm_clock_selection_not_in_mode(self, mock_app):
-        handler = ClockHandler(mock_app)
+    def test_handle_confirm_clock_selection_not_in_mode(self, mock_app, handler):
         mock_app.clock_selection_mode = False
         
         handler.handle_confirm_clock_selection()
@@ -2,27 +2,17 @@ import pytest
 from unittest.mock import Mock
 from handlers.track_handler import TrackHandler
 
+# Overrides of the shared handler app state in conftest
+APP_STATE = {
+    'tracks': [Mock(), None, Mock(), None, None, None, None, None],  # Some tracks assigned
+}
+
+@pytest.fixture
+def handler(mock_app):
+    return TrackHandler(mock_app)
+
 class TestTrackHandler:
-    @pytest.fixture
-    def mock_app(self):
-        app = Mock()
-        app.tracks = [Mock(), None, Mock(), None, None, None, None, None]  # Some tracks assigned
-        app.current_track = 0
-        app.held_track_button = None
-        app.track_edit_mode = False
-        app.track_muted = [False] * 8
-        app.solo_mode = False
-        app.soloed_track = None
-        app.pad_states = {}
-        app._update_track_buttons = Mock()
-        app._init_cc_values_for_track = Mock()
-        app._update_mute_solo_buttons = Mock()
-        app._update_pad_colors = Mock()
-        return app
-        
-    def test_handle_track_selection_valid_track(self, mock_app):
-        handler = TrackHandler(mock_app)
-        
+    def test_handle_track_selection_valid_track(self, mock_app, handler):
         handler.handle_track_selection(2)
         
         assert mock_app.held_track_button == 2
@@ -33,9 +23,7 @@ class TestTrackHandler:
         mock_app._update_pad_colors.assert_called_once()
         assert mock_app.pad_states == {}  # Should be cleared
         
-    def test_handle_track_selection_empty_track(self, mock_app):
-        handler = TrackHandler(mock_app)
-        
+    def test_handle_track_selection_empty_track(self, mock_app, handler):
         handler.handle_track_selection(1)  # Track 1 is None
         
         # Should not change anything for empty track
@@ -43,24 +31,20 @@ class TestTrackHandler:
         assert mock_app.current_track == 0  # Unchanged
         mock_app._update_track_buttons.assert_not_called()
         
-    def test_handle_track_selection_invalid_track(self, mock_app):
-        handler = TrackHandler(mock_app)
-        
+    def test_handle_track_selection_invalid_track(self, mock_app, handler):
         handler.handle_track_selection(8)  # Out of range
         
         assert mock_app.held_track_button is None
         mock_app._update_track_buttons.assert_not_called()
         
-    def test_handle_track_release_normal_mode(self, mock_app):
-        handler = TrackHandler(mock_app)
+    def test_handle_track_release_normal_mode(self, mock_app, handler):
         mock_app.held_track_button = 2
         
         handler.handle_track_release()
         
         assert mock_app.held_track_button is None
         
-    def test_handle_track_release_edit_mode(self, mock_app):
-        handler = TrackHandler(mock_app)
+    def test_handle_track_release_edit_mode(self, mock_app, handler):
         mock_app.held_track_button = 2
         mock_app.track_edit_mode = True
         
@@ -68,27 +52,17 @@ class TestTrackHandler:
         
         assert mock_app.held_track_button == 2  # Should not clear in edit mode
         
-    def test_handle_mute_toggle_on(self, mock_app):
-        handler = TrackHandler(mock_app)
-        mock_app.current_track = 0
-        
-        handler.handle_mute()
-        
-        assert mock_app.track_muted[0] is True
-        mock_app._update_mute_solo_buttons.assert_called_once()
-        
-    def test_handle_mute_toggle_off(self, mock_app):
-        handler = TrackHandler(mock_app)
+    @pytest.mark.parametrize("initial_muted, expected", [(False, True), (True, False)])
+    def test_handle_mute_toggles(self, mock_app, handler, initial_muted, expected):
         mock_app.current_track = 0
-        mock_app.track_muted[0] = True
+        mock_app.track_muted[0] = initial_muted
         
         handler.handle_mute()
         
-        assert mock_app.track_muted[0] is False
+        assert mock_app.track_muted[0] is expected
         mock_app._update_mute_solo_buttons.assert_called_once()
         
-    def test_handle_mute_empty_track(self, mock_app):
-        handler = TrackHandler(mock_app)
+    def test_handle_mute_empty_track(self, mock_app, handler):
         mock_app.current_track = 1  # Empty track
         
         handler.handle_mute()
@@ -97,41 +71,24 @@ class TestTrackHandler:
         assert mock_app.track_muted[1] is False
         mock_app._update_mute_solo_buttons.assert_not_called()
         
-    def test_handle_solo_enable(self, mock_app):
-        handler = TrackHandler(mock_app)
-        mock_app.current_track = 0
+    @pytest.mark.parametrize("current_track, solo_mode, soloed_track, expected_solo_mode, expected_soloed_track", [
+        (0, False, None, True, 0),  # Enable
+        (0, True, 0, False, None),  # Disable
+        (2, True, 0, True, 2),  # Different track soloed, should switch to current track
+    ])
+    def test_handle_solo(self, mock_app, handler, current_track, solo_mode, soloed_track,
+                         expected_solo_mode, expected_soloed_track):
+        mock_app.current_track = current_track
+        mock_app.solo_mode = solo_mode
+        mock_app.soloed_track = soloed_track
         
         handler.handle_solo()
         
-        assert mock_app.solo_mode is True
-        assert mock_app.soloed_track == 0
+        assert mock_app.solo_mode is expected_solo_mode
+        assert mock_app.soloed_track == expected_soloed_track
         mock_app._update_mute_solo_buttons.assert_called_once()
         
-    def test_handle_solo_disable(self, mock_app):
-        handler = TrackHandler(mock_app)
-        mock_app.current_track = 0
-        mock_app.solo_mode = True
-        mock_app.soloed_track = 0
-        
-        handler.handle_solo()
-        
-        assert mock_app.solo_mode is False
-        assert mock_app.soloed_track is None
-        mock_app._update_mute_solo_buttons.assert_called_once()
-        
-    def test_handle_solo_switch_track(self, mock_app):
-        handler = TrackHandler(mock_app)
-        mock_app.current_track = 2
-        mock_app.solo_mode = True
-        mock_app.soloed_track = 0  # Different track soloed
-        
-        handler.handle_solo()
-        
-        assert mock_app.solo_mode is True
-        assert mock_app.soloed_track == 2  # Should switch to current track
-        
-    def test_handle_solo_empty_track(self, mock_app):
-        handler = TrackHandler(mock_app)
+    def test_handle_solo_empty_track(self, mock_app, handler):
         mock_app.current_track = 1  # Empty track
         
         handler.handle_solo()
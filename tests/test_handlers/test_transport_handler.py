@@ -1,43 +1,36 @@
 import pytest
-from unittest.mock import Mock, patch
 from handlers.transport_handler import TransportHandler
 
+CONSTANTS = {
+    'BUTTON_PLAY': 'play_btn',
+    'ANIMATION_PULSING_QUARTER': 'pulse',
+}
+
+# Overrides of the shared handler app state in conftest
+APP_STATE = {
+    'sequencer.is_playing': False,
+    'sequencer.current_step': 5,
+}
+
+@pytest.fixture
+def handler(mock_app):
+    return TransportHandler(mock_app)
+
 class TestTransportHandler:
-    @pytest.fixture
-    def mock_app(self):
-        app = Mock()
-        app.sequencer = Mock()
-        app.sequencer.is_playing = False
-        app.sequencer.current_step = 5
-        app.push = Mock()
-        app.push.buttons = Mock()
-        return app
-        
-    def test_handle_play_when_stopped(self, mock_app):
-        handler = TransportHandler(mock_app)
+    @pytest.mark.parametrize("playing, expected_call, expected_color", [
+        (False, 'play', ('play_btn', 'green', 'pulse')),
+        (True, 'stop', ('play_btn', 'white')),
+    ])
+    def test_handle_play_button(self, mock_app, handler, playing, expected_call, expected_color):
+        mock_app.sequencer.is_playing = playing
         
-        with patch('handlers.transport_handler.push2_python.constants.BUTTON_PLAY', 'play_btn'):
-            with patch('handlers.transport_handler.push2_python.constants.ANIMATION_PULSING_QUARTER', 'pulse'):
-                handler.handle_play()
-                
-        mock_app.sequencer.play.assert_called_once()
-        mock_app.push.buttons.set_button_color.assert_called_with('play_btn', 'green', 'pulse')
-        
-    def test_handle_play_when_playing(self, mock_app):
-        handler = TransportHandler(mock_app)
-        mock_app.sequencer.is_playing = True
-        
-        with patch('handlers.transport_handler.push2_python.constants.BUTTON_PLAY', 'play_btn'):
-            handler.handle_play()
+        handler.handle_play()
             
-        mock_app.sequencer.stop.assert_called_once()
-        mock_app.push.buttons.set_button_color.assert_called_with('play_btn', 'white')
-        
-    def test_handle_stop(self, mock_app):
-        handler = TransportHandler(mock_app)
+        getattr(mock_app.sequencer, expected_call).assert_called_once()
+        mock_app.push.buttons.set_button_color.assert_called_with(*expected_color)
         
-        with patch('handlers.transport_handler.push2_python.constants.BUTTON_PLAY', 'play_btn'):
-            handler.handle_stop()
+    def test_handle_stop(self, mock_app, handler):
+        handler.handle_stop()
             
         mock_app.sequencer.stop.assert_called_once()
         assert mock_app.sequencer.current_step == 0
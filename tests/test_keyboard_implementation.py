@@ -0,0 +1,58 @@
+"""
+Tests for the piano-style keyboard layout and pad range selection
+"""
+
+import time
+
+import pytest
+from unittest.mock import Mock
+from adapters.push2_adapter import Push2Adapter
+from core.sequencer_engine import SequencerEngine
+
+# Expected keyboard layout: white keys on rows 5 and 7, black keys above them with gaps
+EXPECTED_WHITE_KEYS = frozenset((row, col) for row in (5, 7) for col in range(8))
+EXPECTED_BLACK_KEYS = frozenset((row, col) for row in (4, 6) for col in (1, 2, 4, 5, 6))
+EXPECTED_DISABLED_KEYS = frozenset((row, col) for row in (4, 6) for col in (0, 3, 7))
+
+@pytest.fixture(scope="module")
+def adapter():
+    """One simulated Push2Adapter shared by every test in this module
+
+    The hardware and MIDI mocks come from conftest.
+    """
+    return Push2Adapter(SequencerEngine(Mock()), use_simulator=True)
+
+@pytest.mark.parametrize("pos, note", [
+    ((7, 0), 48), ((7, 1), 50), ((7, 7), 60),  # Bottom white row: C3..C4
+    ((5, 0), 60), ((5, 7), 72),                # Upper white row: C4..C5
+    ((6, 1), 49), ((6, 2), 51), ((4, 4), 66),  # Black keys
+])
+def test_piano_note_mapping(adapter, pos, note):
+    """Test the piano keyboard note mapping"""
+    assert adapter.piano_note_mapping[pos] == note
+
+def test_piano_keyboard_layout(adapter):
+    """Test the piano keyboard layout implementation"""
+    assert EXPECTED_WHITE_KEYS <= adapter.white_key_positions, "Missing white key positions"
+    assert EXPECTED_BLACK_KEYS <= adapter.black_key_positions, "Missing black key positions"
+    assert EXPECTED_DISABLED_KEYS <= adapter.disabled_key_positions, "Missing disabled positions"
+    
+    # 16 white keys, 10 black keys and 6 gaps fill the 32 keyboard pads
+    assert len(adapter.white_key_positions) == 16
+    assert len(adapter.black_key_positions) == 10
+    assert len(adapter.disabled_key_positions) == 6
+
+def test_range_selection_system(adapter):
+    """Test the pad-based range selection system"""
+    pad1 = (0, 0)  # Step 0
+    pad2 = (1, 5)  # Step 13
+    
+    # Press both pads
+    adapter.pressed_pads[pad1] = time.monotonic_ns()
+    adapter.pressed_pads[pad2] = time.monotonic_ns()
+    
+    adapter._process_range_selection()
+    
+    assert adapter.selected_range_start == 0
+    assert adapter.selected_range_end == 13
+    assert len(adapter.pressed_pads) == 0  # Should be cleared
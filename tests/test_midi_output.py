@@ -59,6 +59,34 @@ class TestMidiOutput:
         mock_mido.Message.assert_called_with('note_on', channel=0, note=60, velocity=100)
         mock_port.send.assert_called_with(mock_message)
         
+    @patch('midi_output.mido')
+    def test_repeated_note_reuses_message(self, mock_mido):
+        mock_mido.get_output_names.return_value = ['Test Port']
+        mock_mido.get_input_names.return_value = []
+        mock_port = Mock()
+        mock_mido.open_output.return_value = mock_port
+        
+        midi_output = MidiOutput()
+        midi_output.connect('Test Port')
+        midi_output.send_note_on(1, 60, 100)
+        midi_output.send_note_on(1, 60, 100)
+        midi_output.send_note_on(1, 60, 90)
+        
+        assert mock_mido.Message.call_count == 2  # One per distinct (channel, note, velocity)
+        assert mock_port.send.call_count == 3
+        
+    @patch('midi_output.MAX_CACHED_MESSAGES', 4)
+    @patch('midi_output.mido')
+    def test_message_cache_is_bounded(self, mock_mido):
+        mock_mido.get_output_names.return_value = []
+        mock_mido.get_input_names.return_value = []
+        
+        midi_output = MidiOutput()
+        for velocity in range(1, 128):  # Live playing sends every velocity
+            midi_output.send_note_on(1, 60, velocity)
+        
+        assert len(midi_output._messages) <= 4
+        
     @patch('midi_output.mido')
     def test_send_note_off(self, mock_mido):
         mock_mido.get_output_names.return_value = ['Test Port']
@@ -30,7 +30,6 @@ class TestNotePreservationBug:
         assert len(notes_step_17) == 1
         assert len(notes_step_25) == 1
         
-        print("✓ All notes added successfully")
         
         # Step 2: Shorten pattern to 16 steps
         sequencer.set_pattern_length(0, 16)
@@ -49,7 +48,6 @@ class TestNotePreservationBug:
         assert len(notes_step_17_after) == 0  # Not in active pattern
         assert len(notes_step_25_after) == 0  # Not in active pattern
         
-        print("✓ Pattern shortened to 16 steps, notes 17 and 25 preserved")
         
         # Step 3: Extend pattern back to 32 steps
         sequencer.set_pattern_length(0, 32)
@@ -69,7 +67,6 @@ class TestNotePreservationBug:
         assert notes_step_17_restored[0].note == 64
         assert notes_step_25_restored[0].note == 66
         
-        print("✓ Pattern extended back to 32 steps, all notes restored!")
     
     def test_multiple_shorten_extend_cycles(self):
         """Test that note preservation works through multiple cycles"""
@@ -111,7 +108,6 @@ class TestNotePreservationBug:
             assert len(notes) == 1
             assert notes[0].note == expected_note
         
-        print("✓ Multiple shorten/extend cycles preserved all notes")
     
     def test_preserved_notes_dont_conflict_with_new_notes(self):
         """Test that preserved notes don't conflict with newly added notes"""
@@ -134,7 +130,6 @@ class TestNotePreservationBug:
         assert len(notes) == 1
         assert notes[0].note == 62  # New note, not preserved note
         
-        print("✓ New notes properly replace preserved notes")
     
     def test_partial_preservation(self):
         """Test that only notes within new extended range are restored"""
@@ -152,20 +147,7 @@ class TestNotePreservationBug:
         # Extend to 22 steps - should only restore notes within 0-21 range
         sequencer.set_pattern_length(0, 22)
         
-        # Check which notes are restored
-        restored_notes = []
-        for step in [5, 10, 15, 20]:  # Should be restored
-            notes = sequencer.tracks[0].get_notes_at_step( step)
-            if notes:
-                restored_notes.append(step)
-        
-        not_restored_notes = []
-        for step in [25, 30]:  # Should still be preserved but not active
-            notes = sequencer.tracks[0].get_notes_at_step( step)
-            if not notes:
-                not_restored_notes.append(step)
-        
-        assert len(restored_notes) == 4
-        assert len(not_restored_notes) == 2
+        # Steps 5, 10, 15 and 20 are restored; 25 and 30 stay preserved but not active
+        assert sequencer.tracks[0].count_notes_in_range(0, 21) == 4
+        assert sequencer.tracks[0].count_notes_in_range(22, 63) == 0
         
-        print("✓ Partial preservation works correctly")
@@ -31,7 +31,6 @@ class TestPadBasedRangeSelection:
         adapter.disabled_key_positions = set()
         adapter.white_key_positions = set()
         adapter.black_key_positions = set()
-        adapter.track_colors = ['red', 'blue', 'yellow', 'purple', 'cyan', 'pink', 'orange', 'lime']
         adapter._setup_range_aware_note_system()
         
         # Mock the Push2 hardware
@@ -87,8 +86,8 @@ class TestPadBasedRangeSelection:
         pad2 = (2, 5)  # Step 21 (2*8 + 5 = 21)
         
         # Add pressed pads
-        push_adapter.pressed_pads[pad1] = time.time()
-        push_adapter.pressed_pads[pad2] = time.time()
+        push_adapter.pressed_pads[pad1] = time.monotonic_ns()
+        push_adapter.pressed_pads[pad2] = time.monotonic_ns()
         
         # Process range selection
         push_adapter._process_range_selection()
@@ -118,6 +117,24 @@ class TestPadBasedRangeSelection:
         expected_note = 48 + 0 * 8 + 7  # 48 + 7 = 55 (G3)
         assert calculated_note == expected_note
     
+    def test_keyboard_note_table_follows_octave(self, push_adapter):
+        """Test that pad presses resolve notes through the per-octave table"""
+        from adapters.push2_adapter import NO_KEY
+        del push_adapter.disabled_key_positions  # Back to the shared layout
+        
+        assert push_adapter._keyboard_note(7, 0) == 48  # C3
+        assert push_adapter._keyboard_note(4, 1) == 61  # C#4
+        assert push_adapter._keyboard_note(4, 0) == NO_KEY  # Gap in black key row
+        
+        push_adapter.keyboard_octave_offset = 1
+        assert push_adapter._keyboard_note(7, 0) == 60  # Rebuilt for the new octave
+
+        push_adapter.piano_note_mapping = {(7, 0): 50}
+        assert push_adapter._keyboard_note(7, 0) == 62  # Rebuilt for the new mapping
+
+        push_adapter.disabled_key_positions = {(7, 0)}
+        assert push_adapter._keyboard_note(7, 0) == NO_KEY  # Rebuilt for the new gaps
+
     def test_keyboard_octave_control(self, push_adapter):
         """Test keyboard octave adjustment"""
         # Test octave up
@@ -152,7 +169,7 @@ class TestPadBasedRangeSelection:
         """Test pad press state tracking"""
         # Simulate pad press
         pad_id = (1, 3)
-        push_adapter.pressed_pads[pad_id] = time.time()
+        push_adapter.pressed_pads[pad_id] = time.monotonic_ns()
         
         assert pad_id in push_adapter.pressed_pads
         
@@ -196,7 +213,6 @@ class TestPadColorSystem:
         adapter.current_track = 0
         adapter.held_step_pad = None
         adapter.tracks = [Mock() for _ in range(8)]
-        adapter.track_colors = ['red', 'blue', 'yellow', 'purple', 'cyan', 'pink', 'orange', 'lime']
         adapter.disabled_key_positions = set()
         adapter.white_key_positions = set()
         adapter.black_key_positions = set()
@@ -223,13 +239,7 @@ class TestPadColorSystem:
         # Verify that inactive steps are set to light_gray
         for step in [0, 1, 4, 21, 31]:  # Steps outside range
             row, col = mock_push_adapter._get_step_position(step)
-            expected_color = 'light_gray'
-            
-            # Check that set_pad_color was called with inactive color
-            calls = mock_push_adapter.push.pads.set_pad_color.call_args_list
-            pad_call = next((call for call in calls if call[0][0] == (row, col)), None)
-            if pad_call:
-                assert pad_call[0][1] == expected_color
+            assert mock_push_adapter.get_last_color(row, col) == 'light_gray'
     
     def test_current_step_highlighting(self, mock_push_adapter):
         """Test current step highlighting"""
@@ -245,10 +255,19 @@ class TestPadColorSystem:
         mock_push_adapter._update_pad_colors()
         
         # Verify current step is highlighted
-        calls = mock_push_adapter.push.pads.set_pad_color.call_args_list
-        step_10_call = next((call for call in calls if call[0][0] == (1, 2)), None)  # Step 10 = (1, 2)
-        if step_10_call:
-            assert step_10_call[0][1] == 'green'  # Current step should be green
+        assert mock_push_adapter.get_last_color(1, 2) == 'green'  # Step 10 = (1, 2), current step should be green
+    
+    def test_held_step_drawn_over_playhead(self, mock_push_adapter):
+        """Test that the selected step keeps its color while the playhead passes it"""
+        mock_push_adapter.sequencer.is_playing = True
+        mock_push_adapter.sequencer.get_current_step.return_value = 10
+        mock_push_adapter.held_step_pad = 10
+        mock_push_adapter._has_notes_at_step = Mock(return_value=False)
+        
+        mock_push_adapter._update_pad_colors()
+        
+        assert mock_push_adapter.get_last_color(1, 2) == 'blue'
+        assert mock_push_adapter.get_last_color(1, 3) == 'white'
     
     def test_keyboard_pad_colors(self, mock_push_adapter):
         """Test keyboard pad colors"""
@@ -259,13 +278,29 @@ class TestPadColorSystem:
         mock_push_adapter._update_pad_colors()
         
         # Verify keyboard pads show "ready for note input" color
-        calls = mock_push_adapter.push.pads.set_pad_color.call_args_list
-        keyboard_calls = [call for call in calls if call[0][0][0] >= 4]  # Keyboard rows
+        frame = mock_push_adapter.push.pads.set_pads_color.call_args[0][0]
+        keyboard_colors = [color for row in frame[4:] for color in row]  # Keyboard rows
         
-        if keyboard_calls:
-            # Should have some color when ready for note input (white, turquoise, or light_gray)
-            valid_colors = ['white', 'turquoise', 'light_gray', 'dark_gray']
-            assert any(call[0][1] in valid_colors for call in keyboard_calls)
+        # Should have some color when ready for note input (white, turquoise, or light_gray)
+        valid_colors = ['white', 'turquoise', 'light_gray', 'dark_gray']
+        assert all(color in valid_colors for color in keyboard_colors)
+
+    def test_unchanged_frame_is_not_resent(self, mock_push_adapter):
+        """Test that pad colors are only pushed when the frame changes"""
+        mock_push_adapter._update_pad_colors()
+        mock_push_adapter._update_pad_colors()
+        assert mock_push_adapter.push.pads.set_pads_color.call_count == 1
+        
+        # Selecting a step only resends the pad that changed
+        mock_push_adapter.held_step_pad = 3
+        mock_push_adapter._update_pad_colors()
+        assert mock_push_adapter.push.pads.set_pads_color.call_count == 1
+        mock_push_adapter.push.pads.set_pad_color.assert_called_once_with((0, 3), 'blue')
+        
+        # After invalidation the whole frame is sent again
+        mock_push_adapter._invalidate_pad_frame()
+        mock_push_adapter._update_pad_colors()
+        assert mock_push_adapter.push.pads.set_pads_color.call_count == 2
 
 class TestRangeSelectionIntegration:
     """Test integration between range selection and core sequencer"""
@@ -4,76 +4,88 @@ import os
 import tempfile
 from unittest.mock import Mock, patch, mock_open
 from project_manager import ProjectManager
+from sequencer import Note, Pattern
+
+# Saved tracks 1-7 with no device or notes; json.dump only reads them
+EMPTY_TRACKS = tuple({'index': i, 'device': None, 'notes': []} for i in range(1, 8))
+
+def saved_json(mock_file):
+    """Parse the JSON written through a mock_open handle"""
+    return json.loads("".join(call.args[0] for call in mock_file().write.call_args_list))
+
+@pytest.fixture(scope="module")
+def shared_app():
+    """App mock graph built once; the mock_app fixture resets it before every test"""
+    app = Mock()
+    app.sequencer = Mock()
+    
+    # Fix: Use _internal_sequencer.tracks instead of sequencer.tracks
+    app.sequencer._internal_sequencer = Mock()
+    return app
+
+@pytest.fixture(scope="module")
+def shared_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
 
 class TestProjectManager:
     @pytest.fixture
-    def mock_app(self):
-        app = Mock()
-        app.sequencer = Mock()
+    def mock_app(self, shared_app):
+        app = shared_app
+        app.reset_mock(return_value=True, side_effect=True)
         app.sequencer.bpm = 120
-        
-        # Fix: Use _internal_sequencer.tracks instead of sequencer.tracks
-        app.sequencer._internal_sequencer = Mock()
-        app.sequencer._internal_sequencer.tracks = [Mock() for _ in range(8)]
         app.sequencer._internal_sequencer.bpm = 120
         
         app.current_track = 0
         app.tracks = [None] * 8
-        app.device_manager = Mock()
-        app.midi_output = Mock()
-        app._update_track_buttons = Mock()
-        app._init_cc_values_for_track = Mock()
-        app._update_pad_colors = Mock()
-        app.event_bus = Mock()
         app.pad_states = {}
         
-        # Mock pattern notes
-        for i in range(8):
-            app.sequencer._internal_sequencer.tracks[i].notes = []
+        # Real, empty patterns are cheaper than Mocks and hold loaded notes
+        app.sequencer._internal_sequencer.tracks = [Pattern() for _ in range(8)]
             
         return app
         
     @pytest.fixture
-    def temp_dir(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield tmpdir
+    def temp_dir(self, shared_dir):
+        for entry in os.scandir(shared_dir):
+            os.unlink(entry.path)
+        return shared_dir
             
     def test_init_creates_projects_dir(self, mock_app):
-        with patch('project_manager.os.path.expanduser') as mock_expand:
-            with patch('project_manager.os.makedirs') as mock_makedirs:
-                with patch('project_manager.os.path.exists', return_value=False):
-                    mock_expand.return_value = '/test/projects'
-                    
-                    pm = ProjectManager(mock_app)
-                    
-                    assert pm.projects_dir == '/test/projects'
-                    mock_makedirs.assert_called_once_with('/test/projects')
+        with (patch.multiple('project_manager.os.path',
+                             expanduser=Mock(return_value='/test/projects'),
+                             exists=Mock(return_value=False)),
+              patch('project_manager.os.makedirs') as mock_makedirs):
+            pm = ProjectManager(mock_app)
+            
+        assert pm.projects_dir == '/test/projects'
+        mock_makedirs.assert_called_once_with('/test/projects')
                     
     def test_init_existing_projects_dir(self, mock_app):
+        with (patch.multiple('project_manager.os.path',
+                             expanduser=Mock(return_value='/test/projects'),
+                             exists=Mock(return_value=True)),
+              patch('project_manager.os.makedirs') as mock_makedirs):
+            ProjectManager(mock_app)
+            
+        mock_makedirs.assert_not_called()
+                    
+    def test_save_project_basic(self, mock_app):
         with patch('project_manager.os.path.expanduser', return_value='/test/projects'):
             with patch('project_manager.os.path.exists', return_value=True):
-                with patch('project_manager.os.makedirs') as mock_makedirs:
-                    
-                    pm = ProjectManager(mock_app)
-                    
-                    mock_makedirs.assert_not_called()
-                    
-    def test_save_project_basic(self, mock_app, temp_dir):
-        with patch('project_manager.os.path.expanduser', return_value=temp_dir):
-            pm = ProjectManager(mock_app)
+                pm = ProjectManager(mock_app)
             
             with patch('project_manager.datetime') as mock_datetime:
                 mock_datetime.now.return_value.isoformat.return_value = '2024-01-01T12:00:00'
                 
-                pm.save_project('test_project')
+                with patch('project_manager.open', mock_open(), create=True) as mock_file:
+                    pm.save_project('test_project')
                 
-        # Check file was created
-        filepath = os.path.join(temp_dir, 'test_project.json')
-        assert os.path.exists(filepath)
+        # Check file was written
+        mock_file.assert_called_once_with(os.path.join('/test/projects', 'test_project.json'), 'w')
         
         # Check file content
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = saved_json(mock_file)
             
         assert data['version'] == '1.0'
         assert data['bpm'] == 120
@@ -81,9 +93,10 @@ class TestProjectManager:
         assert len(data['tracks']) == 8
         assert pm.current_project_file == 'test_project'
         
-    def test_save_project_with_devices_and_notes(self, mock_app, temp_dir):
-        with patch('project_manager.os.path.expanduser', return_value=temp_dir):
-            pm = ProjectManager(mock_app)
+    def test_save_project_with_devices_and_notes(self, mock_app):
+        with patch('project_manager.os.path.expanduser', return_value='/test/projects'):
+            with patch('project_manager.os.path.exists', return_value=True):
+                pm = ProjectManager(mock_app)
             
             # Setup mock device
             mock_device = Mock()
@@ -100,12 +113,11 @@ class TestProjectManager:
             with patch('project_manager.datetime') as mock_datetime:
                 mock_datetime.now.return_value.isoformat.return_value = '2024-01-01T12:00:00'
                 
-                pm.save_project('test_with_data')
+                with patch('project_manager.open', mock_open(), create=True) as mock_file:
+                    pm.save_project('test_with_data')
                 
         # Check saved data
-        filepath = os.path.join(temp_dir, 'test_with_data.json')
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = saved_json(mock_file)
             
         assert data['tracks'][0]['device'] == {'name': 'Test Device'}
         assert len(data['tracks'][0]['notes']) == 1
@@ -133,8 +145,9 @@ class TestProjectManager:
                         'index': 0,
                         'device': {'name': 'Test Device', 'port': 'Test Port', 'channel': 5},
                         'notes': [{'step': 0, 'note': 60, 'velocity': 100}]
-                    }
-                ] + [{'index': i, 'device': None, 'notes': []} for i in range(1, 8)]
+                    },
+                    *EMPTY_TRACKS,
+                ]
             }
             
             filepath = os.path.join(temp_dir, 'test_load.json')
@@ -152,6 +165,7 @@ class TestProjectManager:
             assert pm.current_project_file == 'test_load'
             mock_app.sequencer.set_bpm.assert_called_with(140)
             assert mock_app.current_track == 2
+            assert mock_app.sequencer._internal_sequencer.tracks[0].notes == (Note(0, 60, 100),)
             
     def test_load_project_device_connection_failed(self, mock_app, temp_dir):
         with patch('project_manager.os.path.expanduser', return_value=temp_dir):
@@ -166,8 +180,9 @@ class TestProjectManager:
                         'index': 0,
                         'device': {'name': 'Test Device'},
                         'notes': []
-                    }
-                ] + [{'index': i, 'device': None, 'notes': []} for i in range(1, 8)]
+                    },
+                    *EMPTY_TRACKS,
+                ]
             }
             
             filepath = os.path.join(temp_dir, 'test_fail.json')
@@ -236,14 +251,15 @@ class TestProjectManager:
             assert sorted(projects) == ['project1', 'project2']
             
     def test_list_projects_nonexistent_dir(self, mock_app):
-        with patch('project_manager.os.path.expanduser', return_value='/nonexistent'):
-            with patch('project_manager.os.makedirs'):
-                with patch('project_manager.os.path.exists', return_value=False):
-                    pm = ProjectManager(mock_app)
-                    
-                    projects = pm.list_projects()
-                    
-                    assert projects == []
+        with (patch.multiple('project_manager.os.path',
+                             expanduser=Mock(return_value='/nonexistent'),
+                             exists=Mock(return_value=False)),
+              patch('project_manager.os.makedirs')):
+            pm = ProjectManager(mock_app)
+            
+            projects = pm.list_projects()
+            
+        assert projects == []
                     
     def test_save_without_existing_project_file(self, mock_app, temp_dir):
         """Test the bug fix: save works even when no project file exists"""
@@ -2,6 +2,13 @@ import pytest
 from unittest.mock import Mock
 from sequencer import Sequencer, Pattern, Note
 
+def _snapshot(sequencer, track=0):
+    """Sorted active steps, preserved notes and range start of a track"""
+    steps = sorted(note.step for note in sequencer.tracks[track].notes)
+    preserved = getattr(sequencer, '_preserved_notes', {}).get(track, {})
+    range_start = getattr(sequencer, '_range_starts', {}).get(track, 0)
+    return steps, preserved, range_start
+
 class TestRangeBasedNotePreservation:
     """Test range-based note preservation and restoration functionality"""
     
@@ -16,41 +23,30 @@ class TestRangeBasedNotePreservation:
         sequencer.tracks[0].add_note(17, 64, 100)  # Position 17
         sequencer.tracks[0].add_note(25, 66, 100)  # Position 25
         
-        assert len(sequencer.tracks[0].notes) == 4
-        note_positions = {note.step for note in sequencer.tracks[0].notes}
-        assert note_positions == {1, 9, 17, 25}
+        steps, _, _ = _snapshot(sequencer)
+        assert steps == [1, 9, 17, 25]
         
         # Step 2: Change to range 10-24 (start 10, length 15)
         sequencer.set_pattern_length(0, 15, range_start=10)
         
         assert sequencer.get_pattern_length(0) == 15
-        range_starts = getattr(sequencer, '_range_starts', {})
-        assert range_starts[0] == 10
+        steps, preserved_notes, range_start = _snapshot(sequencer)
+        assert range_start == 10
         
         # Should have 1 active note (position 17) and 3 preserved notes
-        active_notes = sequencer.tracks[0].notes
-        preserved_notes = getattr(sequencer, '_preserved_notes', {})[0]
-        
-        assert len(active_notes) == 1  # Only note 17
+        assert steps == [7]  # Position 17 becomes step 7 (17-10=7)
         assert len(preserved_notes) == 3  # Notes at 1, 9, 25
-        assert active_notes[0].step == 7  # Position 17 becomes step 7 (17-10=7)
         
         # Step 3: Change back to full range 0-31 (start 0, length 32)
         sequencer.set_pattern_length(0, 32, range_start=0)
         
         assert sequencer.get_pattern_length(0) == 32
-        range_starts = getattr(sequencer, '_range_starts', {})
-        assert range_starts[0] == 0
+        steps, preserved_notes, range_start = _snapshot(sequencer)
+        assert range_start == 0
         
         # All notes should be restored
-        final_active_notes = sequencer.tracks[0].notes
-        final_preserved_notes = getattr(sequencer, '_preserved_notes', {})[0]
-        
-        assert len(final_active_notes) == 4  # All 4 notes restored
-        assert len(final_preserved_notes) == 0  # Nothing preserved
-        
-        final_note_positions = {note.step for note in final_active_notes}
-        assert final_note_positions == {1, 9, 17, 25}  # All original positions
+        assert steps == [1, 9, 17, 25]  # All original positions
+        assert len(preserved_notes) == 0  # Nothing preserved
 
     def test_multiple_range_changes_preserve_all_notes(self):
         """Test that multiple range changes don't lose any notes"""
@@ -59,8 +55,7 @@ class TestRangeBasedNotePreservation:
         
         # Add notes at various positions across the full range
         test_positions = [2, 5, 8, 12, 16, 20, 28, 30]
-        for pos in test_positions:
-            sequencer.tracks[0].add_note(pos, 60 + pos, 100)
+        sequencer.tracks[0].add_notes((pos, 60 + pos, 100) for pos in test_positions)
         
         assert len(sequencer.tracks[0].notes) == 8
         
@@ -68,25 +63,22 @@ class TestRangeBasedNotePreservation:
         sequencer.set_pattern_length(0, 13, range_start=10)
         
         # Only notes within 10-22 should be active: 12, 16, 20
-        active_notes = sequencer.tracks[0].notes
-        assert len(active_notes) == 3
+        steps, _, _ = _snapshot(sequencer)
+        assert steps == [2, 6, 10]
         
         # Change to range 25-30 (different range, no overlap)
         sequencer.set_pattern_length(0, 6, range_start=25)
         
         # Only note at 28, 30 should be active
-        active_notes = sequencer.tracks[0].notes
-        assert len(active_notes) == 2
+        steps, _, _ = _snapshot(sequencer)
+        assert steps == [3, 5]
         
         # Change back to full range
         sequencer.set_pattern_length(0, 32, range_start=0)
         
         # All original notes should be restored
-        final_active_notes = sequencer.tracks[0].notes
-        assert len(final_active_notes) == 8
-        
-        final_note_positions = {note.step for note in final_active_notes}
-        assert final_note_positions == set(test_positions)
+        steps, _, _ = _snapshot(sequencer)
+        assert steps == test_positions
 
     def test_range_changes_preserve_absolute_positioning(self):
         """Test that range changes maintain correct absolute positioning"""
@@ -137,18 +129,13 @@ class TestRangeBasedNotePreservation:
         sequencer.set_pattern_length(0, 10, range_start=20)
         
         # No notes should be active (all preserved)
-        active_notes = sequencer.tracks[0].notes
-        assert len(active_notes) == 0
-        
-        preserved_notes = getattr(sequencer, '_preserved_notes', {})[0]
+        steps, preserved_notes, _ = _snapshot(sequencer)
+        assert steps == []
         assert len(preserved_notes) == 3  # All notes preserved
         
         # Change back to full range
         sequencer.set_pattern_length(0, 32, range_start=0)
         
         # All notes should be restored
-        final_active_notes = sequencer.tracks[0].notes
-        assert len(final_active_notes) == 3
-        
-        final_note_positions = {note.step for note in final_active_notes}
-        assert final_note_positions == {2, 7, 12}
+        steps, _, _ = _snapshot(sequencer)
+        assert steps == [2, 7, 12]
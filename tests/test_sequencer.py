@@ -30,6 +30,44 @@ class TestPattern:
         notes = pattern.get_notes_at_step(0)
         assert len(notes) == 0
 
+    def test_get_notes_at_step_reuses_stored_tuple(self):
+        pattern = Pattern()
+        pattern.add_note(3, 60, 100)
+
+        assert pattern.get_notes_at_step(3) is pattern.get_notes_at_step(3)
+        assert pattern.get_notes_at_step(3) == (Note(3, 60, 100),)
+
+    def test_notes_view_follows_edits(self):
+        pattern = Pattern()
+        pattern.add_note(4, 60, 100)
+        pattern.add_note(0, 62, 100)
+        pattern.add_note(4, 64, 100)  # Replacing moves the note to the end
+        
+        assert [(n.step, n.note) for n in pattern.notes] == [(0, 62), (4, 64)]
+        
+        pattern.remove_note(0)
+        assert [n.step for n in pattern.notes] == [4]
+        
+        pattern.notes = [Note(1, 60, 100), Note(1, 61, 100)]  # Last note per step wins
+        assert pattern.notes == (Note(1, 61, 100),)
+        assert len(pattern.get_notes_at_step(2)) == 0
+        
+    def test_add_notes(self):
+        pattern = Pattern(length=8)
+        pattern.add_notes([(0, 60, 100), (3, 62, 90), (3, 64, 80), (8, 65, 100)])
+        
+        # Same rules as add_note: last note per step wins, out-of-range steps are dropped
+        assert pattern.notes == (Note(0, 60, 100), Note(3, 64, 80))
+        
+    def test_count_notes_in_range(self):
+        pattern = Pattern()
+        for step in (0, 5, 6, 31):
+            pattern.add_note(step, 60, 100)
+        
+        assert pattern.count_notes_in_range(0, 31) == 4
+        assert pattern.count_notes_in_range(5, 30) == 2
+        assert pattern.count_notes_in_range(7, 30) == 0
+
 class TestSequencer:
     def test_init(self, mock_midi_output):
         sequencer = Sequencer(mock_midi_output, bpm=120)
@@ -73,17 +111,24 @@ class TestSequencer:
             if sequencer.is_playing:
                 sequencer.stop()
         
-    @patch('time.time')
-    def test_trigger_step_advances(self, mock_time, mock_midi_output):
-        mock_time.return_value = 1000.0
+    def test_trigger_step_advances(self, mock_midi_output):
         sequencer = Sequencer(mock_midi_output)
         sequencer.current_step = 5
         sequencer.current_step_notes = set()  # Initialize required attribute
         
-        sequencer._trigger_step()
+        sequencer._trigger_step(1000.0)
         
         assert sequencer.current_step == 6
         
+    def test_trigger_step_schedules_note_off_from_step_time(self, mock_midi_output):
+        sequencer = Sequencer(mock_midi_output, bpm=120)
+        sequencer.current_step_notes = set()  # Initialize required attribute
+        
+        sequencer._trigger_step(1000.0)
+        
+        # 90% of a 16th note at 120 BPM after the step was due, however late it ran
+        assert sequencer.note_off_time == pytest.approx(1000.0 + 0.125 * 0.9)
+        
     def test_trigger_step_wraps_at_default_length(self, mock_midi_output):
         sequencer = Sequencer(mock_midi_output)
         # Set first track to step 31 (last step of 32-step pattern)
@@ -96,9 +141,7 @@ class TestSequencer:
         assert sequencer.current_step == 0
         assert sequencer.current_steps[0] == 0
         
-    @patch('time.time')
-    def test_trigger_step_plays_notes(self, mock_time, mock_midi_output):
-        mock_time.return_value = 1000.0
+    def test_trigger_step_plays_notes(self, mock_midi_output):
         sequencer = Sequencer(mock_midi_output)
         sequencer.current_step_notes = set()  # Initialize required attribute
         
@@ -106,7 +149,7 @@ class TestSequencer:
         sequencer.tracks[0].add_note(0, 60, 100)
         sequencer.current_step = 0
         
-        sequencer._trigger_step()
+        sequencer._trigger_step(1000.0)
         
         mock_midi_output.send_note_on.assert_called_once_with(1, 60, 100, None)
         
@@ -117,6 +160,16 @@ class TestSequencer:
         sequencer.handle_midi_clock()
         
         assert sequencer._clock_count == initial_count + 1
+
+    def test_handle_midi_clock_estimates_bpm(self, mock_midi_output):
+        sequencer = Sequencer(mock_midi_output)
+        pulse = 60.0 / (140 * 24)  # 24 clocks per quarter note
+
+        with patch('sequencer.time.monotonic', side_effect=[1000.0 + i * pulse for i in range(25)]):
+            for _ in range(25):
+                sequencer.handle_midi_clock()
+
+        assert sequencer.bpm == 140
         
     def test_handle_midi_start_enables_external_sync(self, mock_midi_output):
         sequencer = Sequencer(mock_midi_output)
@@ -4,7 +4,9 @@
 from core.sequencer_engine import SequencerEngine
 from core.sequencer_event_bus import EventType
 from midi_output import MidiOutput
-import time
+import threading
+
+STEPS_TO_PLAY = 16
 
 def main():
     print("🎵 Testing standalone sequencer (no Push2 required)")
@@ -13,9 +15,16 @@ def main():
     midi_output = MidiOutput()
     sequencer = SequencerEngine(midi_output)
     
-    # Subscribe to events
+    # Subscribe to events; playback stops once enough steps have gone by
+    steps_played = 0
+    done = threading.Event()
+    
     def on_step_changed(event):
+        nonlocal steps_played
         print(f"Step: {event.data['current_step']}")
+        steps_played += 1
+        if steps_played >= STEPS_TO_PLAY:
+            done.set()
     
     def on_play_state_changed(event):
         state = "PLAYING" if event.data['is_playing'] else "STOPPED"
@@ -43,12 +52,13 @@ def main():
     sequencer.set_bpm(140)
     
     # Start playback
-    print(f"\n▶️ Starting playback for 5 seconds...")
+    print(f"\n▶️ Starting playback for {STEPS_TO_PLAY} steps...")
     try:
         sequencer.play()
         
-        # Let it play for a bit
-        time.sleep(5)
+        # Wait for the steps rather than a fixed time; the timeout only guards a stalled clock
+        if not done.wait(timeout=5):
+            print(f"Only {steps_played} steps played before the timeout")
         
         # Stop playback
         print(f"\n⏹️ Stopping playback...")
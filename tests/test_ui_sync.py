@@ -24,7 +24,6 @@ class TestUI_SequencerSynchronization:
         adapter.pressed_pads = {}
         adapter.held_keyboard_pads = set()
         adapter.tracks = [Mock() for _ in range(8)]
-        adapter.track_colors = ['red', 'blue', 'yellow', 'purple', 'cyan', 'pink', 'orange', 'lime']
         adapter.disabled_key_positions = set()
         adapter.white_key_positions = set()
         adapter.black_key_positions = set()
@@ -52,8 +51,8 @@ class TestUI_SequencerSynchronization:
         # Simulate 2-pad press selecting range 0-15 (16 steps)
         pad1 = (0, 0)  # Step 0
         pad2 = (1, 7)  # Step 15
-        adapter.pressed_pads[pad1] = time.time()
-        adapter.pressed_pads[pad2] = time.time()
+        adapter.pressed_pads[pad1] = time.monotonic_ns()
+        adapter.pressed_pads[pad2] = time.monotonic_ns()
         
         # Process range selection
         adapter._process_range_selection()
@@ -81,8 +80,8 @@ class TestUI_SequencerSynchronization:
         
         for (pad1, pad2, expected_length) in test_cases:
             # Set up range selection
-            adapter.pressed_pads[pad1] = time.time()
-            adapter.pressed_pads[pad2] = time.time()
+            adapter.pressed_pads[pad1] = time.monotonic_ns()
+            adapter.pressed_pads[pad2] = time.monotonic_ns()
             
             # Process selection
             adapter._process_range_selection()
@@ -105,7 +104,6 @@ class TestUI_SequencerSynchronization:
         adapter.push = Mock()
         adapter.push.pads = Mock()
         adapter.tracks = [Mock() for _ in range(8)]
-        adapter.track_colors = ['red', 'blue', 'yellow', 'purple', 'cyan', 'pink', 'orange', 'lime']
         adapter.held_step_pad = None
         
         # Set a partial range (steps 5-20)
@@ -115,32 +113,26 @@ class TestUI_SequencerSynchronization:
         # Call pad update
         adapter._update_pad_colors()
         
-        # Verify all 64 pads were set to some color (32 sequencer + 32 keyboard)
-        assert adapter.push.pads.set_pad_color.call_count == 64
-        
-        # Check pad color calls
-        call_args_list = adapter.push.pads.set_pad_color.call_args_list
+        # Verify all 64 pads were set in a single batch (32 sequencer + 32 keyboard)
+        adapter.push.pads.set_pads_color.assert_called_once()
+        frame = adapter.push.pads.set_pads_color.call_args[0][0]
+        assert len(frame) == 8
+        assert all(len(row) == 8 and None not in row for row in frame)
         
         # Check steps 0-4 (outside range) - should be light_gray
         for step in range(5):
             row, col = step // 8, step % 8
-            pad_call = next((call for call in call_args_list if call[0][0] == (row, col)), None)
-            assert pad_call is not None
-            assert pad_call[0][1] == 'light_gray'
+            assert frame[row][col] == 'light_gray'
         
         # Check steps 5-20 (inside range) - should NOT be light_gray
         for step in range(5, 21):
             row, col = step // 8, step % 8
-            pad_call = next((call for call in call_args_list if call[0][0] == (row, col)), None)
-            assert pad_call is not None
-            assert pad_call[0][1] != 'light_gray'  # Should be white, not light_gray
+            assert frame[row][col] != 'light_gray'  # Should be white, not light_gray
         
         # Check steps 21-31 (outside range) - should be light_gray
         for step in range(21, 32):
             row, col = step // 8, step % 8
-            pad_call = next((call for call in call_args_list if call[0][0] == (row, col)), None)
-            assert pad_call is not None
-            assert pad_call[0][1] == 'light_gray'
+            assert frame[row][col] == 'light_gray'
     
     def test_keyboard_c_notes_highlighting(self, setup_ui_sync):
         """Test that C notes on keyboard are highlighted differently"""
@@ -150,7 +142,6 @@ class TestUI_SequencerSynchronization:
         adapter.push = Mock()
         adapter.push.pads = Mock()
         adapter.tracks = [Mock() for _ in range(8)]
-        adapter.track_colors = ['red', 'blue', 'yellow', 'purple', 'cyan', 'pink', 'orange', 'lime']
         adapter.disabled_key_positions = set()
         adapter.white_key_positions = set()
         adapter.black_key_positions = set()
@@ -172,11 +163,49 @@ class TestUI_SequencerSynchronization:
         # Test pad coloring includes keyboard rows
         adapter._update_pad_colors()
         
-        # Count calls for keyboard rows
-        keyboard_calls = [call for call in adapter.push.pads.set_pad_color.call_args_list 
-                         if call[0][0][0] >= 4]  # Keyboard rows
+        # Count colored keyboard pads
+        frame = adapter.push.pads.set_pads_color.call_args[0][0]
+        keyboard_colors = [color for row in frame[4:] for color in row if color is not None]
+        
+        assert len(keyboard_colors) == 32  # 4 rows * 8 cols = 32 keyboard pads
+    
+    def test_step_notes_scanned_once_per_refresh(self, setup_ui_sync, monkeypatch):
+        """Test that pad refresh groups notes by step instead of querying every pad"""
+        adapter, sequencer = setup_ui_sync
+        adapter.piano_note_mapping = {(5, 0): 60, (5, 1): 62}
+        adapter.held_step_pad = 4
+        
+        from sequencer import Note, Pattern
+        pattern = sequencer._internal_sequencer.tracks[0]
+        pattern.notes = [Note(4, 60, 100), Note(9, 64, 100)]
+        # Pattern is slotted, so the method is patched on the class
+        monkeypatch.setattr(Pattern, 'get_notes_at_step', Mock(side_effect=AssertionError("per-step query")))
+        
+        adapter._update_pad_colors()
+        
+        assert adapter.get_last_color(0, 4) == 'blue'  # Held step
+        assert adapter.get_last_color(1, 1) == 'red'  # Step 9 has notes (track color)
+        assert adapter.get_last_color(1, 2) == 'white'  # Step 10 is empty
+        assert adapter.get_last_color(5, 0) == 'blue'  # Note 60 exists at the held step
+        assert adapter.get_last_color(5, 1) != 'blue'
+    
+    def test_unchanged_state_skips_pad_rebuild(self, setup_ui_sync):
+        """Test that pad refresh is skipped until something visible changes"""
+        adapter, sequencer = setup_ui_sync
+        adapter._update_pad_colors()
+        
+        adapter._collect_step_notes = Mock(return_value={})
+        adapter._update_pad_colors()
+        assert not adapter._collect_step_notes.called
+        
+        # Editing the pattern invalidates the cached state
+        sequencer._internal_sequencer.tracks[0].add_note(3, 60, 100)
+        adapter._update_pad_colors()
+        assert adapter._collect_step_notes.call_count == 1
         
-        assert len(keyboard_calls) == 32  # 4 rows * 8 cols = 32 keyboard pads
+        adapter.held_keyboard_pads.add((5, 0))
+        adapter._update_pad_colors()
+        assert adapter._collect_step_notes.call_count == 2
     
     def test_default_pattern_length_is_32(self):
         """Test that new patterns default to 32 steps instead of 16"""
@@ -201,8 +230,8 @@ class TestUI_SequencerSynchronization:
         # Set range to 8 steps
         pad1 = (0, 0)  # Step 0
         pad2 = (1, 0)  # Step 8
-        adapter.pressed_pads[pad1] = time.time()
-        adapter.pressed_pads[pad2] = time.time()
+        adapter.pressed_pads[pad1] = time.monotonic_ns()
+        adapter.pressed_pads[pad2] = time.monotonic_ns()
         adapter._process_range_selection()
         
         # Verify both UI and sequencer are at 9 steps
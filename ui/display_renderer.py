@@ -1,7 +1,16 @@
+import sys
+from functools import lru_cache
 import push2_python
 import cairo
 import numpy
 
+PITCH_CLASSES = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+# Name of every MIDI note number, e.g. 60 -> "C4"
+NOTE_NAMES = tuple(f"{PITCH_CLASSES[n % 12]}{(n // 12) - 1}" for n in range(128))
+# Keys of the CC values dict, interned so they are the very objects the
+# 'encoder_N' literals in the encoder handler refer to
+CC_ENCODER_KEYS = tuple(sys.intern(f"encoder_{i + 1}") for i in range(8))
+
 class DisplayRenderer:
     def __init__(self):
         self.WIDTH = push2_python.constants.DISPLAY_LINE_PIXELS
@@ -11,43 +20,80 @@ class DisplayRenderer:
         self.FONT_SIZE_SMALL = 12
         self.FONT_SIZE_MED = 18
         self.FONT_SIZE_LARGE = 36
-        
-    def _trim_device_name(self, name):
-        """Trim device name at first space to keep display clean"""
-        trimmed_name = name
-        words = name.split(' ')
-        if len(words) > 1:
-            trimmed_name = ' '.join(words[:2])
-        return trimmed_name
+        # CC encoder label keys and x positions, one per display column
+        self._encoder_labels = tuple((key, i * self.BUTTON_WIDTH + 10) for i, key in enumerate(CC_ENCODER_KEYS))
+        
+        # One surface, context and frame view reused by every render
+        self._surface = None
+        self._ctx = None
+        self._frame = None
+        # Pixels of each view's static labels, keyed by view name
+        self._backgrounds = {}
+        
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _trim_device_name(name):
+        """Trim device name to its first two words to keep display clean"""
+        return ' '.join(name.split(' ', 2)[:2])
     
     def _note_to_name(self, note_num):
         """Convert MIDI note number to note name"""
-        notes = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        octave = (note_num // 12) - 1
-        note_name = notes[note_num % 12]
-        return f"{note_name}{octave}"
-        
-    def create_surface(self):
-        """Create and setup Cairo surface"""
-        surface = cairo.ImageSurface(cairo.FORMAT_RGB16_565, self.WIDTH, self.HEIGHT)
-        ctx = cairo.Context(surface)
-        # Clear background
-        ctx.set_source_rgb(0, 0, 0)
-        ctx.rectangle(0, 0, self.WIDTH, self.HEIGHT)
-        ctx.fill()
-        ctx.set_source_rgb(1, 1, 1)
-        ctx.select_font_face("Helvetica", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+        if 0 <= note_num < 128:
+            return NOTE_NAMES[note_num]
+        return f"{PITCH_CLASSES[note_num % 12]}{(note_num // 12) - 1}"
+        
+    def create_surface(self, background=None):
+        """Clear the shared Cairo surface, or fill it with a cached background, and return it with its context"""
+        if self._surface is None:
+            self._surface = cairo.ImageSurface(cairo.FORMAT_RGB16_565, self.WIDTH, self.HEIGHT)
+            self._ctx = cairo.Context(self._surface)
+            # Every view draws white bold text; nothing else changes the source or face
+            self._ctx.set_source_rgb(1, 1, 1)
+            self._ctx.select_font_face("Helvetica", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+            frame = numpy.ndarray(shape=(self.HEIGHT, self.WIDTH), dtype=numpy.uint16,
+                                  buffer=self._surface.get_data())
+            # Push2 frames are (WIDTH, HEIGHT); the sender transposes back to this
+            # row-major buffer before flattening, so the view needs no copy here
+            self._frame = frame.transpose()
+        surface, ctx = self._surface, self._ctx
+        # Clear background straight in the pixel buffer; black is 0 in RGB565
+        surface.flush()
+        if background is None:
+            self._frame.fill(0)
+        else:
+            self._frame[...] = background
+        surface.mark_dirty()
+        ctx.new_path()
         return surface, ctx
         
+    def _background(self, name, draw_labels):
+        """Static labels of a view, drawn once by draw_labels(ctx) and reused after"""
+        background = self._backgrounds.get(name)
+        if background is None:
+            surface, ctx = self.create_surface()
+            draw_labels(ctx)
+            surface.flush()
+            # order='K' keeps the buffer's layout, so restoring it is a straight copy
+            background = self._backgrounds[name] = self._frame.copy(order='K')
+        return background
+        
     def surface_to_frame(self, surface):
-        """Convert Cairo surface to Push2 frame"""
+        """Convert Cairo surface to Push2 frame
+
+        The shared surface's frame is a view over its pixels, so it is only
+        valid until the next render.
+        """
+        surface.flush()
+        if surface is self._surface:
+            return self._frame
         buf = surface.get_data()
         frame = numpy.ndarray(shape=(self.HEIGHT, self.WIDTH), dtype=numpy.uint16, buffer=buf)
         return frame.transpose()
         
     def render_device_selection(self, ui_state, device_manager, current_track):
         """Render device selection interface"""
-        surface, ctx = self.create_surface()
+        background = self._background('device_selection', self._draw_device_selection_labels)
+        surface, ctx = self.create_surface(background)
         
         # Title
         ctx.set_font_size(self.FONT_SIZE_MED)
@@ -64,7 +110,10 @@ class DisplayRenderer:
             ctx.move_to(10, 75)
             ctx.show_text(f"{self._trim_device_name(device.name)} (Ch {device.channel})")
         
-        # Button labels
+        return self.surface_to_frame(surface)
+        
+    def _draw_device_selection_labels(self, ctx):
+        """Button labels of the device selection view"""
         ctx.set_font_size(self.FONT_SIZE_SMALL)
         ctx.move_to(5, 12)
         ctx.show_text("Devices")
@@ -73,30 +122,53 @@ class DisplayRenderer:
         ctx.move_to(self.BUTTON_WIDTH * 7 + self.BUTTON_LABEL_PADDING, 12)
         ctx.show_text("OK")
         
-        return self.surface_to_frame(surface)
-        
     def render_clock_selection(self, ui_state, clock_sources):
         """Render clock selection interface"""
-        surface, ctx = self.create_surface()
-        
-        ctx.set_font_size(self.FONT_SIZE_MED)
-        ctx.move_to(10, 65)
-        ctx.show_text("Select Clock Source")
+        background = self._background('clock_selection', self._draw_clock_selection_labels)
+        surface, ctx = self.create_surface(background)
         
         clock_source = clock_sources[ui_state.clock_selection_index]
         ctx.set_font_size(self.FONT_SIZE_SMALL)
         ctx.move_to(10, 85)
         ctx.show_text(f"{clock_source}")
         
+        return self.surface_to_frame(surface)
+        
+    def _draw_clock_selection_labels(self, ctx):
+        """Title and button label of the clock selection view"""
+        ctx.set_font_size(self.FONT_SIZE_MED)
+        ctx.move_to(10, 65)
+        ctx.show_text("Select Clock Source")
+        
+        ctx.set_font_size(self.FONT_SIZE_SMALL)
         ctx.move_to(self.BUTTON_WIDTH * 7 + self.BUTTON_LABEL_PADDING, 12)
         ctx.show_text("OK")
         
-        return self.surface_to_frame(surface)
-        
     def render_session_mode(self, ui_state, project_manager):
         """Render session management interface"""
-        surface, ctx = self.create_surface()
+        background = self._background('session', self._draw_session_labels)
+        surface, ctx = self.create_surface(background)
+        
+        # Current action
+        ctx.set_font_size(self.FONT_SIZE_SMALL)
+        ctx.move_to(10, 85)
+        if ui_state.session_action == 'open':
+            projects = project_manager.list_projects()
+            if projects:
+                project_name = projects[ui_state.session_project_index]
+                ctx.show_text(f"Open: {project_name}")
+        elif ui_state.session_action == 'save':
+            if project_manager.current_project_file:
+                ctx.show_text(f"Save: {project_manager.current_project_file}")
+            else:
+                ctx.show_text("Save: New project")
+        elif ui_state.session_action == 'save_new':
+            ctx.show_text("Save as new project")
+        
+        return self.surface_to_frame(surface)
         
+    def _draw_session_labels(self, ctx):
+        """Button labels and title of the session view"""
         # Button labels
         ctx.set_font_size(self.FONT_SIZE_SMALL)
         ctx.move_to(5, 12)
@@ -120,40 +192,20 @@ class DisplayRenderer:
         ctx.move_to(10, 50)
         ctx.show_text("Session Options")
         
-        # Current action
-        ctx.set_font_size(self.FONT_SIZE_SMALL)
-        ctx.move_to(10, 85)
-        if ui_state.session_action == 'open':
-            projects = project_manager.list_projects()
-            if projects:
-                project_name = projects[ui_state.session_project_index]
-                ctx.show_text(f"Open: {project_name}")
-        elif ui_state.session_action == 'save':
-            if project_manager.current_project_file:
-                ctx.show_text(f"Save: {project_manager.current_project_file}")
-            else:
-                ctx.show_text("Save: New project")
-        elif ui_state.session_action == 'save_new':
-            ctx.show_text("Save as new project")
-        
-        return self.surface_to_frame(surface)
-        
     def render_main_display(self, sequencer, device_manager, tracks, current_track, cc_values, octave, midi_output, app_ref=None):
         """Render main sequencer display"""
         surface, ctx = self.create_surface()
         
         # CC encoder labels and values
         ctx.set_font_size(self.FONT_SIZE_SMALL)
-        for i in range(8):
-            encoder_key = f"encoder_{i+1}"
-            if encoder_key in cc_values:
-                cc_info = cc_values[encoder_key]
-                x = i * (self.WIDTH // 8) + 10
-                name = cc_info["name"][:10] if len(cc_info["name"]) > 10 else cc_info["name"]
-                ctx.move_to(x, 12)
-                ctx.show_text(name)
-                ctx.move_to(x, 24)
-                ctx.show_text(str(cc_info["value"]))
+        for encoder_key, x in self._encoder_labels:
+            cc_info = cc_values.get(encoder_key)
+            if cc_info is None:
+                continue  # Device maps fewer than 8 CCs
+            ctx.move_to(x, 12)
+            ctx.show_text(cc_info["name"][:10])  # Slicing a short name returns it as is
+            ctx.move_to(x, 24)
+            ctx.show_text(str(cc_info["value"]))
         
         # Track info
         ctx.set_font_size(self.FONT_SIZE_MED)
@@ -172,8 +224,7 @@ class DisplayRenderer:
         ctx.show_text(f"Clock: {clock_source} | BPM: {sequencer.bpm} | {status}")
         
         # Step note information (bottom left)
-        if (app_ref and hasattr(app_ref, 'held_step_pad') and 
-            app_ref.held_step_pad is not None and 
+        if (app_ref and app_ref.held_step_pad is not None and 
             tracks[current_track] is not None):
             
             step = app_ref.held_step_pad
@@ -183,12 +234,11 @@ class DisplayRenderer:
             ctx.set_font_size(self.FONT_SIZE_SMALL)
             y_pos = self.HEIGHT - 25
             
-            if notes and len(notes) > 0:
+            if notes:
                 for i, note in enumerate(notes):
-                    if hasattr(note, 'note') and hasattr(note, 'velocity'):
-                        note_name = self._note_to_name(note.note)
-                        ctx.move_to(10, y_pos + i * 12)
-                        ctx.show_text(f"Step {step}: {note_name} ({note.note}) Vel:{note.velocity}")
+                    note_name = self._note_to_name(note.note)
+                    ctx.move_to(10, y_pos + i * 12)
+                    ctx.show_text(f"Step {step}: {note_name} ({note.note}) Vel:{note.velocity}")
             else:
                 ctx.move_to(10, y_pos)
                 ctx.show_text(f"Step {step}: (empty)")
@@ -1,9 +1,12 @@
+import logging
 import push2_python
 import cairo
 import numpy
 from ui.ui_state_manager import UIStateManager
 from ui.display_renderer import DisplayRenderer
 
+logger = logging.getLogger(__name__)
+
 class SequencerUI:
     def __init__(self, sequencer, device_manager):
         self.sequencer = sequencer
@@ -17,54 +20,65 @@ class SequencerUI:
         # New components
         self.ui_state = UIStateManager()
         self.renderer = DisplayRenderer()
+        # Shown when rendering fails; built once rather than on every failed frame
+        self._blank_frame = numpy.zeros((self.renderer.WIDTH, self.renderer.HEIGHT), dtype=numpy.uint16)
+        
+        # Frame cache: bumped by invalidate() whenever something drawn changes
+        self.frame_version = 0
+        self._frame = None
+        self._frame_version = -1
         
     def generate_pattern_display(self):
-        try:
-            current_track = self.app_ref.current_track if self.app_ref else 0
-            
-            # Sync UI state with app state
-            if self.app_ref:
-                self.ui_state.device_selection_mode = getattr(self.app_ref, 'device_selection_mode', False)
-                self.ui_state.clock_selection_mode = getattr(self.app_ref, 'clock_selection_mode', False)
-                self.ui_state.session_mode = getattr(self.app_ref, 'session_mode', False)
-                self.ui_state.track_edit_mode = getattr(self.app_ref, 'track_edit_mode', False)
-                self.ui_state.device_selection_index = getattr(self.app_ref, 'device_selection_index', 0)
-                self.ui_state.clock_selection_index = getattr(self.app_ref, 'clock_selection_index', 0)
-                self.ui_state.session_project_index = getattr(self.app_ref, 'session_project_index', 0)
-                self.ui_state.session_action = getattr(self.app_ref, 'session_action', None)
-                self.ui_state.held_track_button = getattr(self.app_ref, 'held_track_button', None)
-                
+        app = self.app_ref
+        current_track = app.current_track if app else 0
+        
+        # Sync UI state with app state; the adapter sets all of these in __init__
+        ui_state = self.ui_state
+        if app:
+            ui_state.device_selection_mode = app.device_selection_mode
+            ui_state.clock_selection_mode = app.clock_selection_mode
+            ui_state.session_mode = app.session_mode
+            ui_state.track_edit_mode = app.track_edit_mode
+            ui_state.device_selection_index = app.device_selection_index
+            ui_state.clock_selection_index = app.clock_selection_index
+            ui_state.session_project_index = app.session_project_index
+            ui_state.session_action = app.session_action
+            ui_state.held_track_button = app.held_track_button
 
-            
-            # Route to appropriate renderer
-            if self.ui_state.device_selection_mode:
+        # Route to appropriate renderer; the first mode that is on wins
+        match ui_state:
+            case UIStateManager(device_selection_mode=True):
                 return self.renderer.render_device_selection(
-                    self.ui_state, self.device_manager, current_track)
-            elif self.ui_state.clock_selection_mode:
+                    ui_state, self.device_manager, current_track)
+            case UIStateManager(clock_selection_mode=True):
                 return self.renderer.render_clock_selection(
-                    self.ui_state, self.app_ref.midi_output.clock_sources)
-            elif self.ui_state.session_mode:
+                    ui_state, app.midi_output.clock_sources)
+            case UIStateManager(session_mode=True):
                 return self.renderer.render_session_mode(
-                    self.ui_state, self.app_ref.project_manager)
-            else:
+                    ui_state, app.project_manager)
+            case _:
                 return self.renderer.render_main_display(
-                    self.sequencer, self.device_manager, self.app_ref.tracks,
-                    current_track, self.cc_values, self.octave, self.app_ref.midi_output, self.app_ref)
+                    self.sequencer, self.device_manager, app.tracks,
+                    current_track, self.cc_values, self.octave, app.midi_output, app)
 
-        except Exception as e:
-            print(f"Display error: {e}")
-            # Return a simple fallback frame
-            return numpy.zeros((self.renderer.WIDTH, self.renderer.HEIGHT), dtype=numpy.uint16)
-
-    def _note_to_name(self, note_num):
-        notes = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        octave = (note_num // 12) - 1
-        note_name = notes[note_num % 12]
-        return f"{note_name}{octave}"
-        
     # Expose UI state for external access
     def get_ui_state(self):
         return self.ui_state
 
+    def invalidate(self):
+        """Mark the current frame stale so the next request re-renders it"""
+        self.frame_version += 1
+
     def get_current_frame(self):
-        return self.generate_pattern_display()  # Default fallback
+        # Reuse the last frame until something visible changes
+        version = self.frame_version
+        if self._frame is None or self._frame_version != version:
+            try:
+                frame = self.generate_pattern_display()
+            except Exception:
+                logger.exception("Display error")
+                # Leave the cache stale so the next request retries the render
+                return self._blank_frame
+            self._frame = frame
+            self._frame_version = version
+        return self._frame